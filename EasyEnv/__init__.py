@@ -26,26 +26,34 @@ bl_info = {
 
 
 import bpy
-import bpy.utils.previews
 import os
-import numpy as np
+import threading
+import importlib.util
+from bpy.app.handlers import persistent
 from bpy_extras.io_utils import ImportHelper
-from mathutils import Matrix
 
 
 addon_keymaps = {}
 _icons = None
+_ASSETS_DIR = os.path.join(os.path.dirname(__file__), 'assets')
+_ASSETS_BLEND = os.path.join(_ASSETS_DIR, '3DGS Render APPEND V4.blend')
+_icon_ids = {}  # icon name -> preview icon_id, resolved once in register()
 _env_status_cache = None
 _env_status_cache_time = 0
+_env_status_cache_ttl = 5.0  # Seconds; raised after a failed check
 _env_fully_installed = False  # Once True, stop checking
+_view3d_area_cache = {}  # screen pointer -> index of its 3D View area
 
+# KIRI_3DGS_Render_GN camera inputs: view matrix (Socket_2-17) and projection
+# matrix (Socket_18-33), both column-major, then window width/height (Socket_34-35)
+_CAMERA_SOCKETS = tuple(f'Socket_{i}' for i in range(2, 36))
 
-def property_exists(prop_path, glob, loc):
-    try:
-        eval(prop_path, glob, loc)
-        return True
-    except:
-        return False
+# Environment status rows shown in the panel: (status key, ready label, missing label)
+_STATUS_ROWS = (
+    ('python_installed', 'Python: Installed', 'Python: Not Installed'),
+    ('packages_installed', 'Packages: Installed', 'Packages: Not Installed'),
+    ('checkpoint_exists', 'Checkpoint: Downloaded', 'Checkpoint: Not Downloaded'),
+)
 
 
 def invalidate_env_cache():
@@ -55,25 +63,32 @@ def invalidate_env_cache():
     _env_status_cache_time = 0
     _env_fully_installed = False
 
+    # Also drop the wrapper's interpreter probes
+    from . import sharp_wrapper
+    sharp_wrapper.invalidate_env_cache()
+
 
 def get_cached_environment_status():
     """
     Get environment status with smart caching:
     - If fully installed: cache permanently (never check again)
     - If installing: cache for 5 seconds
+    - If the check itself failed: back off for 30 seconds
     - On first load: check once
     """
-    import time
-    global _env_status_cache, _env_status_cache_time, _env_fully_installed
+    global _env_status_cache, _env_status_cache_time, _env_status_cache_ttl, _env_fully_installed
 
     # If we already confirmed full installation, return cached result immediately
     if _env_fully_installed and _env_status_cache is not None:
         return _env_status_cache
 
-    current_time = time.time()
+    import time
+
+    # Monotonic clock so wall-clock jumps cannot pin or bypass the cache
+    current_time = time.monotonic()
 
-    # If not fully installed, cache for 5 seconds (for installation progress)
-    if _env_status_cache is not None and (current_time - _env_status_cache_time) < 5.0:
+    # If not fully installed, cache for a while (5 s for installation progress, longer after errors)
+    if _env_status_cache is not None and (current_time - _env_status_cache_time) < _env_status_cache_ttl:
         return _env_status_cache
 
     # Update cache by checking environment
@@ -82,6 +97,7 @@ def get_cached_environment_status():
         status = env_installer.check_environment_status()
         _env_status_cache = status
         _env_status_cache_time = current_time
+        _env_status_cache_ttl = 5.0
 
         # If fully installed, mark as complete and stop checking
         if status['python_installed'] and status['packages_installed'] and status['checkpoint_exists']:
@@ -91,7 +107,11 @@ def get_cached_environment_status():
         return status
     except Exception as e:
         print(f"EasyEnv: Error checking environment status: {e}")
-        return {'python_installed': False, 'packages_installed': False, 'checkpoint_exists': False}
+        # Cache the failure too, so a persistent error is not retried on every redraw
+        _env_status_cache = {'python_installed': False, 'packages_installed': False, 'checkpoint_exists': False}
+        _env_status_cache_time = current_time
+        _env_status_cache_ttl = 30.0
+        return _env_status_cache
 
 
 def load_preview_icon(path):
@@ -104,6 +124,14 @@ def load_preview_icon(path):
     return _icons[path].icon_id
 
 
+def tag_redraw_view3d_areas():
+    """Redraw the 3D Views only; other editors do not display the splats"""
+    if bpy.context and bpy.context.screen:
+        for a in bpy.context.screen.areas:
+            if a.type == 'VIEW_3D':
+                a.tag_redraw()
+
+
 def sna_update_active_object_update_mode_868D4(self, context):
     """Update handler for Active Object Update Mode property"""
     sna_updated_prop = self.active_object_update_mode
@@ -111,9 +139,7 @@ def sna_update_active_object_update_mode_868D4(self, context):
     bpy.context.view_layer.objects.active.modifiers['KIRI_3DGS_Render_GN']['Socket_50'] = (2 if (sna_updated_prop == 'Show As Point Cloud') else (1 if (sna_updated_prop != 'Enable Camera Updates') else 0))
     bpy.context.view_layer.objects.active.modifiers['KIRI_3DGS_Render_GN'].show_viewport = (True if (sna_updated_prop != 'Disable Camera Updates') else False)
     bpy.context.view_layer.objects.active.update_tag(refresh={'OBJECT'}, )
-    if bpy.context and bpy.context.screen:
-        for a in bpy.context.screen.areas:
-            a.tag_redraw()
+    tag_redraw_view3d_areas()
 
 
 def sna_update_enable_active_camera_updates_DE26E(self, context):
@@ -130,106 +156,118 @@ def sna_update_enable_active_camera_updates_DE26E(self, context):
         bpy.context.view_layer.objects.active.modifiers['KIRI_3DGS_Render_GN']['Socket_54'] = sna_updated_prop
 
 
+def find_view3d_area(screen):
+    """Return the first 3D View area of a screen, remembering its index per screen"""
+    areas = screen.areas
+    key = screen.as_pointer()
+    index = _view3d_area_cache.get(key)
+    if index is not None and index < len(areas) and areas[index].type == 'VIEW_3D':
+        return areas[index]
+
+    for index, area in enumerate(areas):
+        if area.type == 'VIEW_3D':
+            _view3d_area_cache[key] = index
+            return area
+
+    _view3d_area_cache.pop(key, None)
+    return None
+
+
+@persistent
+def _clear_view3d_area_cache(dummy):
+    """Screen pointers are not stable across file loads"""
+    _view3d_area_cache.clear()
+
+
+def _flatten_matrix(matrix):
+    """Flatten a 4x4 matrix column by column to match the socket order"""
+    return [value for column in matrix.col for value in column]
+
+
+def _camera_values(view_matrix, proj_matrix, window_width, window_height):
+    """Flatten the camera state in _CAMERA_SOCKETS order"""
+    return tuple(_flatten_matrix(view_matrix) + _flatten_matrix(proj_matrix) + [window_width, window_height])
+
+
+def _write_camera_values(obj, values):
+    """Write flattened camera values into the object's render modifier"""
+    geometryNodes_modifier = obj.modifiers.get('KIRI_3DGS_Render_GN')
+    if not geometryNodes_modifier:
+        print(f"Error: GeometryNodes modifier not found on object '{obj.name}'.")
+        return False
+
+    # Update view/projection matrices and window dimensions in one pass
+    for name, value in zip(_CAMERA_SOCKETS, values):
+        geometryNodes_modifier[name] = value
+    return True
+
+
+def _camera_values_current(obj, values):
+    """Whether the object's render modifier already holds these camera values"""
+    geometryNodes_modifier = obj.modifiers.get('KIRI_3DGS_Render_GN')
+    if not geometryNodes_modifier:
+        return False
+    return all(geometryNodes_modifier.get(name) == value for name, value in zip(_CAMERA_SOCKETS, values))
+
+
+def update_gaussian_splat_camera(obj, view_matrix, proj_matrix, window_width, window_height):
+    """Push view/projection matrices and window size into the object's render modifier"""
+    return _write_camera_values(obj, _camera_values(view_matrix, proj_matrix, window_width, window_height))
+
+
 def sna_update_camera_single_time_9EF18():
     """Update all 3DGS objects to current camera view"""
-    from mathutils import Matrix
-    
-    # Define helper function for updating the geometry node sockets
-    def update_gaussian_splat_camera(obj, view_matrix, proj_matrix, window_width, window_height):
-        geometryNodes_modifier = obj.modifiers.get('KIRI_3DGS_Render_GN')
-        if not geometryNodes_modifier:
-            print(f"Error: GeometryNodes modifier not found on object '{obj.name}'.")
-            return False
-        
-        # Update view matrix
-        geometryNodes_modifier['Socket_2'] = view_matrix[0][0]
-        geometryNodes_modifier['Socket_3'] = view_matrix[1][0]
-        geometryNodes_modifier['Socket_4'] = view_matrix[2][0]
-        geometryNodes_modifier['Socket_5'] = view_matrix[3][0]
-        geometryNodes_modifier['Socket_6'] = view_matrix[0][1]
-        geometryNodes_modifier['Socket_7'] = view_matrix[1][1]
-        geometryNodes_modifier['Socket_8'] = view_matrix[2][1]
-        geometryNodes_modifier['Socket_9'] = view_matrix[3][1]
-        geometryNodes_modifier['Socket_10'] = view_matrix[0][2]
-        geometryNodes_modifier['Socket_11'] = view_matrix[1][2]
-        geometryNodes_modifier['Socket_12'] = view_matrix[2][2]
-        geometryNodes_modifier['Socket_13'] = view_matrix[3][2]
-        geometryNodes_modifier['Socket_14'] = view_matrix[0][3]
-        geometryNodes_modifier['Socket_15'] = view_matrix[1][3]
-        geometryNodes_modifier['Socket_16'] = view_matrix[2][3]
-        geometryNodes_modifier['Socket_17'] = view_matrix[3][3]
-        
-        # Update projection matrix
-        geometryNodes_modifier['Socket_18'] = proj_matrix[0][0]
-        geometryNodes_modifier['Socket_19'] = proj_matrix[1][0]
-        geometryNodes_modifier['Socket_20'] = proj_matrix[2][0]
-        geometryNodes_modifier['Socket_21'] = proj_matrix[3][0]
-        geometryNodes_modifier['Socket_22'] = proj_matrix[0][1]
-        geometryNodes_modifier['Socket_23'] = proj_matrix[1][1]
-        geometryNodes_modifier['Socket_24'] = proj_matrix[2][1]
-        geometryNodes_modifier['Socket_25'] = proj_matrix[3][1]
-        geometryNodes_modifier['Socket_26'] = proj_matrix[0][2]
-        geometryNodes_modifier['Socket_27'] = proj_matrix[1][2]
-        geometryNodes_modifier['Socket_28'] = proj_matrix[2][2]
-        geometryNodes_modifier['Socket_29'] = proj_matrix[3][2]
-        geometryNodes_modifier['Socket_30'] = proj_matrix[0][3]
-        geometryNodes_modifier['Socket_31'] = proj_matrix[1][3]
-        geometryNodes_modifier['Socket_32'] = proj_matrix[2][3]
-        geometryNodes_modifier['Socket_33'] = proj_matrix[3][3]
-        
-        # Update window dimensions
-        geometryNodes_modifier['Socket_34'] = window_width
-        geometryNodes_modifier['Socket_35'] = window_height
-        
-        return True
-    
     # Find view and projection matrices from the 3D view area
-    found_3d_view = False
-    for area in bpy.context.screen.areas:
-        if area.type == 'VIEW_3D':
-            view_matrix = area.spaces.active.region_3d.view_matrix
-            proj_matrix = area.spaces.active.region_3d.window_matrix
-            window_width = area.width
-            window_height = area.height
-            found_3d_view = True
-            break
-    
-    if not found_3d_view:
+    area = find_view3d_area(bpy.context.screen)
+    if area is None:
         print("Error: No 3D View found in the current screen.")
         return
+
+    region_3d = area.spaces.active.region_3d
+    values = _camera_values(region_3d.view_matrix, region_3d.window_matrix, area.width, area.height)
     
-    # Update all enabled 3DGS objects
+    # Update all enabled 3DGS objects whose camera state is out of date
     updated_objects = []
+    unchanged_count = 0
     for obj in bpy.context.scene.objects:
         if 'update_rot_to_cam' in obj and obj['update_rot_to_cam']:
-            if update_gaussian_splat_camera(obj, view_matrix, proj_matrix, window_width, window_height):
+            # Compare against the sockets themselves, so edits, undo and re-added modifiers are seen
+            if _camera_values_current(obj, values):
+                unchanged_count += 1
+                continue
+            if _write_camera_values(obj, values):
                 updated_objects.append(obj.name)
     
     if updated_objects:
         print(f"Updated {len(updated_objects)} object(s): {', '.join(updated_objects)}")
-    else:
+        # Force refresh of the view the matrices came from
+        area.tag_redraw()
+    elif not unchanged_count:
         print("No enabled 3DGS objects found to update.")
-    
-    # Force viewport refresh
-    if bpy.context and bpy.context.screen:
-        for a in bpy.context.screen.areas:
-            a.tag_redraw()
+
+
+def _append_assets(node_groups=(), materials=()):
+    """Append any missing node groups/materials from the asset library in a single file read"""
+    missing_node_groups = [name for name in node_groups if name not in bpy.data.node_groups]
+    missing_materials = [name for name in materials if name not in bpy.data.materials]
+    if not (missing_node_groups or missing_materials):
+        return
+
+    with bpy.data.libraries.load(_ASSETS_BLEND, link=False) as (data_from, data_to):
+        data_to.node_groups = missing_node_groups
+        data_to.materials = missing_materials
+
+
+def _ensure_node_group(name):
+    """Return the named node group, appending it from the asset library if missing"""
+    _append_assets(node_groups=(name,))
+    return bpy.data.node_groups[name]
 
 
 def sna_append_and_add_geo_nodes_function_execute_6BCD7(Node_Group_Name, Modifier_Name, Object):
     """Append geometry node group from library file and add as modifier"""
-    if not property_exists(f"bpy.data.node_groups['{Node_Group_Name}']", globals(), locals()):
-        before_data = list(bpy.data.node_groups)
-        bpy.ops.wm.append(
-            directory=os.path.join(os.path.dirname(__file__), 'assets', '3DGS Render APPEND V4.blend') + r'\NodeTree', 
-            filename=Node_Group_Name, 
-            link=False
-        )
-        new_data = list(filter(lambda d: not d in before_data, list(bpy.data.node_groups)))
-        appended_65345 = None if not new_data else new_data[0]
-    
     modifier = Object.modifiers.new(name=Modifier_Name, type='NODES')
-    modifier.node_group = bpy.data.node_groups[Node_Group_Name]
+    modifier.node_group = _ensure_node_group(Node_Group_Name)
     return modifier
 
 
@@ -247,79 +285,23 @@ class EASYENV_OT_Align_Active_To_View(bpy.types.Operator):
         return not False
 
     def execute(self, context):
-        from mathutils import Matrix
-        
-        # Define helper function for updating the geometry node sockets
-        def update_gaussian_splat_camera(obj, view_matrix, proj_matrix, window_width, window_height):
-            geometryNodes_modifier = obj.modifiers.get('KIRI_3DGS_Render_GN')
-            if not geometryNodes_modifier:
-                print(f"Error: GeometryNodes modifier not found on object '{obj.name}'.")
-                return False
-            
-            # Update view matrix
-            geometryNodes_modifier['Socket_2'] = view_matrix[0][0]
-            geometryNodes_modifier['Socket_3'] = view_matrix[1][0]
-            geometryNodes_modifier['Socket_4'] = view_matrix[2][0]
-            geometryNodes_modifier['Socket_5'] = view_matrix[3][0]
-            geometryNodes_modifier['Socket_6'] = view_matrix[0][1]
-            geometryNodes_modifier['Socket_7'] = view_matrix[1][1]
-            geometryNodes_modifier['Socket_8'] = view_matrix[2][1]
-            geometryNodes_modifier['Socket_9'] = view_matrix[3][1]
-            geometryNodes_modifier['Socket_10'] = view_matrix[0][2]
-            geometryNodes_modifier['Socket_11'] = view_matrix[1][2]
-            geometryNodes_modifier['Socket_12'] = view_matrix[2][2]
-            geometryNodes_modifier['Socket_13'] = view_matrix[3][2]
-            geometryNodes_modifier['Socket_14'] = view_matrix[0][3]
-            geometryNodes_modifier['Socket_15'] = view_matrix[1][3]
-            geometryNodes_modifier['Socket_16'] = view_matrix[2][3]
-            geometryNodes_modifier['Socket_17'] = view_matrix[3][3]
-            
-            # Update projection matrix
-            geometryNodes_modifier['Socket_18'] = proj_matrix[0][0]
-            geometryNodes_modifier['Socket_19'] = proj_matrix[1][0]
-            geometryNodes_modifier['Socket_20'] = proj_matrix[2][0]
-            geometryNodes_modifier['Socket_21'] = proj_matrix[3][0]
-            geometryNodes_modifier['Socket_22'] = proj_matrix[0][1]
-            geometryNodes_modifier['Socket_23'] = proj_matrix[1][1]
-            geometryNodes_modifier['Socket_24'] = proj_matrix[2][1]
-            geometryNodes_modifier['Socket_25'] = proj_matrix[3][1]
-            geometryNodes_modifier['Socket_26'] = proj_matrix[0][2]
-            geometryNodes_modifier['Socket_27'] = proj_matrix[1][2]
-            geometryNodes_modifier['Socket_28'] = proj_matrix[2][2]
-            geometryNodes_modifier['Socket_29'] = proj_matrix[3][2]
-            geometryNodes_modifier['Socket_30'] = proj_matrix[0][3]
-            geometryNodes_modifier['Socket_31'] = proj_matrix[1][3]
-            geometryNodes_modifier['Socket_32'] = proj_matrix[2][3]
-            geometryNodes_modifier['Socket_33'] = proj_matrix[3][3]
-            
-            # Update window dimensions
-            geometryNodes_modifier['Socket_34'] = window_width
-            geometryNodes_modifier['Socket_35'] = window_height
-            
-            return True
-        
         # Find view and projection matrices from the 3D view area
-        found_3d_view = False
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                view_matrix = area.spaces.active.region_3d.view_matrix
-                proj_matrix = area.spaces.active.region_3d.window_matrix
-                window_width = area.width
-                window_height = area.height
-                found_3d_view = True
-                break
-        
-        if not found_3d_view:
+        area = find_view3d_area(bpy.context.screen)
+        if area is None:
             self.report({'ERROR'}, "No 3D View found in the current screen.")
             return {'CANCELLED'}
+
+        region_3d = area.spaces.active.region_3d
+        view_matrix = region_3d.view_matrix
+        proj_matrix = region_3d.window_matrix
+        window_width = area.width
+        window_height = area.height
         
         # Update the active object
         obj = bpy.context.view_layer.objects.active
         if obj and update_gaussian_splat_camera(obj, view_matrix, proj_matrix, window_width, window_height):
             obj.update_tag(refresh={'OBJECT'})
-            if bpy.context and bpy.context.screen:
-                for a in bpy.context.screen.areas:
-                    a.tag_redraw()
+            area.tag_redraw()
             self.report({'INFO'}, f"Updated {obj.name} to current view")
             return {"FINISHED"}
         else:
@@ -339,28 +321,43 @@ class EASYENV_OT_Install_Environment(bpy.types.Operator):
 
     _timer = None
     _thread = None
+    _queue = None  # Messages from the worker thread: ('progress', message) or ('done', success, error)
     _status_message = "Starting installation..."
-    _is_running = False
-    _error_message = None
-    _success = False
 
     def modal(self, context, event):
         if event.type == 'TIMER':
-            # Update UI with current status
-            context.area.tag_redraw()
+            import queue
+
+            # Drain everything the worker reported since the last tick
+            status_changed = False
+            result = None
+            while True:
+                try:
+                    message = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if message[0] == 'progress':
+                    self._status_message = message[1]
+                    status_changed = True
+                else:
+                    result = message
 
-            # Check if installation thread is still running
-            if not self._is_running:
+            # Update UI only when the status actually changed
+            if status_changed:
+                context.area.tag_redraw()
+
+            if result is not None:
                 # Installation finished
                 self.cancel(context)
 
-                if self._success:
+                _, success, error_message = result
+                if success:
                     # Invalidate cache to force recheck of environment status
                     invalidate_env_cache()
                     self.report({'INFO'}, "Environment installation complete!")
                     return {'FINISHED'}
                 else:
-                    error_msg = self._error_message or "Unknown error"
+                    error_msg = error_message or "Unknown error"
                     self.report({'ERROR'}, f"Installation failed: {error_msg}")
                     return {'CANCELLED'}
 
@@ -368,6 +365,7 @@ class EASYENV_OT_Install_Environment(bpy.types.Operator):
 
     def execute(self, context):
         import threading
+        import queue
         import sys
 
         # Check platform support
@@ -383,31 +381,31 @@ class EASYENV_OT_Install_Environment(bpy.types.Operator):
             self.report({'ERROR'}, f"Failed to import installer: {e}")
             return {'CANCELLED'}
 
-        # Check current status
-        status = env_installer.check_environment_status()
+        # Check current status (shares the panel's cache instead of rescanning)
+        status = get_cached_environment_status()
 
         if status['python_installed'] and status['packages_installed'] and status['checkpoint_exists']:
             self.report({'INFO'}, "Environment is already fully installed!")
             return {'FINISHED'}
 
+        # Worker thread only talks to the modal handler through this queue
+        self._queue = queue.Queue()
+        message_queue = self._queue
+
         # Define installation function to run in thread
         def install_thread():
             try:
                 def progress_callback(message):
-                    self._status_message = message
+                    message_queue.put(('progress', message))
                     print(f"[Install] {message}")
 
-                self._is_running = True
                 env_installer.install_environment_windows(progress_callback)
-                self._success = True
+                message_queue.put(('done', True, None))
 
             except Exception as e:
-                self._error_message = str(e)
-                self._success = False
+                message_queue.put(('done', False, str(e)))
                 import traceback
                 traceback.print_exc()
-            finally:
-                self._is_running = False
 
         # Start installation in background thread
         self._thread = threading.Thread(target=install_thread, daemon=True)
@@ -450,6 +448,7 @@ class EASYENV_OT_Generate_Gaussians_From_Image(bpy.types.Operator, ImportHelper)
     def execute(self, context):
         from pathlib import Path
         import tempfile
+        import numpy as np
         
         image_path = Path(self.filepath)
         
@@ -573,35 +572,29 @@ class EASYENV_OT_Generate_Gaussians_From_Image(bpy.types.Operator, ImportHelper)
                 obj['3DGS_Mesh_Type'] = 'vert'
                 
                 # Create color attributes
-                SH_0 = 0.28209479177387814
                 point_count = len(mesh.vertices)
                 
-                f_dc_0_data = np.array([v.value for v in mesh.attributes['f_dc_0'].data])
-                f_dc_1_data = np.array([v.value for v in mesh.attributes['f_dc_1'].data])
-                f_dc_2_data = np.array([v.value for v in mesh.attributes['f_dc_2'].data])
-                opacity_data = np.array([v.value for v in mesh.attributes['opacity'].data])
-                
-                color_data = []
-                for i in range(point_count):
-                    R = max(0.0, min(1.0, f_dc_0_data[i] * SH_0 + 0.5))
-                    G = max(0.0, min(1.0, f_dc_1_data[i] * SH_0 + 0.5))
-                    B = max(0.0, min(1.0, f_dc_2_data[i] * SH_0 + 0.5))
-                    A = max(0.0, min(1.0, 1 / (1 + np.exp(-opacity_data[i]))))
-                    color_data.extend([R, G, B, A])
-                
-                # Create Col attribute
-                if 'Col' in mesh.attributes:
-                    mesh.attributes.remove(mesh.attributes['Col'])
-                col_attr = mesh.attributes.new(name="Col", type='FLOAT_COLOR', domain='POINT')
-                col_attr.data.foreach_set("color", color_data)
-                
-                # Create KIRI_3DGS_Paint attribute
-                if 'KIRI_3DGS_Paint' in mesh.attributes:
-                    mesh.attributes.remove(mesh.attributes['KIRI_3DGS_Paint'])
-                paint_attr = mesh.attributes.new(name="KIRI_3DGS_Paint", type='FLOAT_COLOR', domain='POINT')
-                paint_attr.data.foreach_set("color", color_data)
-                mesh.color_attributes.active_color = paint_attr
-                
+                # Bulk-copy attribute values into one float32 staging block,
+                # one contiguous row per attribute (no per-element Python access)
+                attribute_block = np.empty((4, point_count), dtype=np.float32)
+                for row, attr_name in zip(attribute_block, ('f_dc_0', 'f_dc_1', 'f_dc_2', 'opacity')):
+                    mesh.attributes[attr_name].data.foreach_get('value', row)
+
+                # RGBA per point (Numba kernel when available, NumPy otherwise).
+                # The kernel only touches NumPy buffers, so it runs on a worker thread
+                # while the asset library is read; RNA writes stay here.
+                from . import splat_colors
+                from concurrent.futures import ThreadPoolExecutor
+                executor = ThreadPoolExecutor(max_workers=1)
+                color_future = executor.submit(splat_colors.build_color_buffer, attribute_block)
+                executor.shutdown(wait=False)
+
+                # Append the node groups and material in one pass over the asset library
+                _append_assets(
+                    node_groups=('KIRI_3DGS_Render_GN', 'KIRI_3DGS_Adjust_Colour_And_Material'),
+                    materials=('KIRI_3DGS_Render_Material',)
+                )
+
                 # Add geometry node modifiers
                 sna_append_and_add_geo_nodes_function_execute_6BCD7('KIRI_3DGS_Render_GN', 'KIRI_3DGS_Render_GN', obj)
                 sna_append_and_add_geo_nodes_function_execute_6BCD7('KIRI_3DGS_Adjust_Colour_And_Material', 'KIRI_3DGS_Adjust_Colour_And_Material', obj)
@@ -617,21 +610,23 @@ class EASYENV_OT_Generate_Gaussians_From_Image(bpy.types.Operator, ImportHelper)
                 obj.easyenv_dgs_object_properties.enable_active_camera_updates = False
                 obj.easyenv_dgs_object_properties.active_object_update_mode = 'Enable Camera Updates'
                 
-                # Append and assign material
-                if not property_exists("bpy.data.materials['KIRI_3DGS_Render_Material']", globals(), locals()):
-                    before_data = list(bpy.data.materials)
-                    bpy.ops.wm.append(
-                        directory=os.path.join(os.path.dirname(__file__), 'assets', '3DGS Render APPEND V4.blend') + r'\Material',
-                        filename='KIRI_3DGS_Render_Material',
-                        link=False
-                    )
+                color_data = color_future.result()
 
+                # Create Col attribute
+                if 'Col' in mesh.attributes:
+                    mesh.attributes.remove(mesh.attributes['Col'])
+                col_attr = mesh.attributes.new(name="Col", type='FLOAT_COLOR', domain='POINT')
+                col_attr.data.foreach_set("color", color_data)
+                
+                # Create KIRI_3DGS_Paint attribute
+                if 'KIRI_3DGS_Paint' in mesh.attributes:
+                    mesh.attributes.remove(mesh.attributes['KIRI_3DGS_Paint'])
+                paint_attr = mesh.attributes.new(name="KIRI_3DGS_Paint", type='FLOAT_COLOR', domain='POINT')
+                paint_attr.data.foreach_set("color", color_data)
+                mesh.color_attributes.active_color = paint_attr
+                
                 # Remove existing material slots and assign KIRI material
-                while len(obj.material_slots) > 0:
-                    bpy.context.view_layer.objects.active = obj
-                    bpy.context.object.active_material_index = 0
-                    bpy.ops.object.material_slot_remove()
-
+                obj.data.materials.clear()
                 obj.data.materials.append(bpy.data.materials['KIRI_3DGS_Render_Material'])
                 obj.modifiers['KIRI_3DGS_Render_GN']['Socket_61'] = bpy.data.materials['KIRI_3DGS_Render_Material']
                 
@@ -685,20 +680,11 @@ class EASYENV_PT_Main_Panel(bpy.types.Panel):
             box.label(text='Environment Setup', icon='PREFERENCES')
 
             col = box.column(align=True)
-            if not status['python_installed']:
-                col.label(text='Python: Not Installed', icon='CANCEL')
-            else:
-                col.label(text='Python: Installed', icon='CHECKMARK')
-
-            if not status['packages_installed']:
-                col.label(text='Packages: Not Installed', icon='CANCEL')
-            else:
-                col.label(text='Packages: Installed', icon='CHECKMARK')
-
-            if not status['checkpoint_exists']:
-                col.label(text='Checkpoint: Not Downloaded', icon='CANCEL')
-            else:
-                col.label(text='Checkpoint: Downloaded', icon='CHECKMARK')
+            for key, ready_text, missing_text in _STATUS_ROWS:
+                if status[key]:
+                    col.label(text=ready_text, icon='CHECKMARK')
+                else:
+                    col.label(text=missing_text, icon='CANCEL')
 
             # Install Environment button
             row = box.row()
@@ -742,11 +728,11 @@ class EASYENV_PT_Main_Panel(bpy.types.Panel):
             if obj.easyenv_dgs_object_properties.active_object_update_mode != 'Disable Camera Updates':
                 row = box.row()
                 row.scale_y = 1.3
-                icon_path = os.path.join(os.path.dirname(__file__), 'assets', 'eye.svg')
-                if os.path.exists(icon_path):
+                icon_id = _icon_ids.get('eye', 0)
+                if icon_id:
                     op = row.operator('easyenv.align_active_to_view',
                                     text='Update Active To View',
-                                    icon_value=load_preview_icon(icon_path))
+                                    icon_value=icon_id)
                 else:
                     op = row.operator('easyenv.align_active_to_view',
                                     text='Update Active To View',
@@ -809,10 +795,58 @@ class EASYENV_GROUP_generation_settings(bpy.types.PropertyGroup):
     )
 
 
+class EASYENV_AddonPreferences(bpy.types.AddonPreferences):
+    """Add-on preferences"""
+    bl_idname = __package__
+
+    warm_up_mlsharp_worker: bpy.props.BoolProperty(
+        name="Start ML-Sharp Worker at Startup",
+        description="Start the ML-Sharp worker in the background when the add-on loads, so the first "
+                    "generation skips the torch import. Uses memory while Blender is open",
+        default=True
+    )
+
+    def draw(self, context):
+        self.layout.prop(self, 'warm_up_mlsharp_worker')
+
+
+def _warm_up_enabled():
+    """Whether register() should start the ml-sharp worker early (never in background mode)"""
+    if bpy.app.background:
+        return False
+    addon = bpy.context.preferences.addons.get(__package__)
+    return addon is None or addon.preferences.warm_up_mlsharp_worker
+
+
+def _warm_splat_colors():
+    """Compile/load the Numba color kernel off the main thread"""
+    try:
+        from . import splat_colors
+        splat_colors.warm_up()
+    except Exception as e:
+        print(f"Color kernel warm-up failed: {e}")
+
+
+def _warm_mlsharp_worker():
+    """Start the ml-sharp worker in the background once the environment is fully installed"""
+    try:
+        from . import env_installer, sharp_wrapper
+        status = env_installer.check_environment_status()
+        if status['packages_installed'] and status['checkpoint_exists']:
+            sharp_wrapper.warmup_mlsharp()
+    except Exception as e:
+        print(f"ML-Sharp worker warm-up failed: {e}")
+
+
 def register():
     """Register addon classes and properties"""
     global _icons
+    # Previews are only needed once the add-on is enabled, not at import time
+    import bpy.utils.previews
     _icons = bpy.utils.previews.new()
+    _icon_ids['eye'] = load_preview_icon(os.path.join(_ASSETS_DIR, 'eye.svg'))
+
+    bpy.utils.register_class(EASYENV_AddonPreferences)
 
     # Register property groups
     bpy.utils.register_class(EASYENV_GROUP_dgs_object_properties)
@@ -837,13 +871,35 @@ def register():
     # Register UI panel
     bpy.utils.register_class(EASYENV_PT_Main_Panel)
 
+    bpy.app.handlers.load_post.append(_clear_view3d_area_cache)
+
+    # Numba is optional; without it there is nothing to compile ahead of the first import
+    if importlib.util.find_spec('numba') is not None:
+        threading.Thread(target=_warm_splat_colors, daemon=True).start()
+
+    # Pay the worker's torch/sharp import cost now rather than on the first Generate click
+    # (skipped for headless runs and when disabled in the preferences)
+    if _warm_up_enabled():
+        threading.Thread(target=_warm_mlsharp_worker, daemon=True).start()
+
     print("3DGS Render (Minimal) addon registered")
 
 
 def unregister():
     """Unregister addon classes and properties"""
     global _icons
+    import bpy.utils.previews
     bpy.utils.previews.remove(_icons)
+    _icons = None
+    _icon_ids.clear()
+
+    if _clear_view3d_area_cache in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_clear_view3d_area_cache)
+    _view3d_area_cache.clear()
+
+    # Stop the persistent ml-sharp worker so it does not outlive the add-on
+    from . import sharp_wrapper
+    sharp_wrapper.shutdown_worker()
 
     # Unregister UI panel
     bpy.utils.unregister_class(EASYENV_PT_Main_Panel)
@@ -860,6 +916,8 @@ def unregister():
     del bpy.types.Object.easyenv_dgs_object_properties
     bpy.utils.unregister_class(EASYENV_GROUP_dgs_object_properties)
 
+    bpy.utils.unregister_class(EASYENV_AddonPreferences)
+
     print("3DGS Render (Minimal) addon unregistered")
 
 
@@ -5,12 +5,11 @@ Downloads and sets up the ML-Sharp Python environment and checkpoint.
 
 import os
 import sys
-import subprocess
-import zipfile
-import shutil
 from pathlib import Path
 from typing import Optional, Callable
 
+from .process_affinity import background_cores, set_process_affinity
+
 
 ADDON_DIR = Path(__file__).parent
 MLSHARP_DIR = ADDON_DIR / "ml-sharp"
@@ -27,79 +26,334 @@ PYTHON_DOWNLOADS = {
 # Bundled files (included in GitHub repo to avoid download issues)
 BUNDLED_PYTHON_ZIP = BUNDLED_PYTHON_DIR / "python-3.13.0-embed-amd64.zip"
 BUNDLED_GET_PIP = BUNDLED_PYTHON_DIR / "get-pip.py"
+# Optional zstd-compressed tarball of the same embeddable Python; used instead of the zip when present
+BUNDLED_PYTHON_TAR_ZST = BUNDLED_PYTHON_DIR / "python-3.13.0-embed-amd64.tar.zst"
+
+# Written after a complete Python extraction; holds the archive identity so re-installs can skip it
+PYTHON_INSTALL_STAMP = MLSHARP_ENV_DIR / ".install_version"
 
 # Checkpoint URL (too large to bundle, must download)
 CHECKPOINT_URL = "https://huggingface.co/TimChen/ml-sharp/resolve/main/sharp_2572gikvuh.pt?download=true"
 CHECKPOINT_FILENAME = "sharp_2572gikvuh.pt"
 CHECKPOINT_EXPECTED_SIZE = 2809738232  # 2.6168 GB - exact file size for validation
+CHECKPOINT_SHA256 = None  # Hex digest of the checkpoint; set it to verify downloads (size is always checked)
+# Sidecar recording which checkpoint file (mtime/size) last passed the SHA-256 check
+CHECKPOINT_VERIFIED_FILE = MLSHARP_DIR / (CHECKPOINT_FILENAME + ".sha256.ok")
+
+# Persistent wheel cache so re-running the installer does not redownload packages
+PIP_CACHE_DIR = MLSHARP_DIR / ".pip-cache"
+PIP_INSTALL_OPTIONS = ["--cache-dir", str(PIP_CACHE_DIR), "--prefer-binary"]
+# Optional folder of pre-downloaded wheels, searched before the package index when present
+BUNDLED_WHEELS_DIR = MLSHARP_DIR / "wheels"
+
+
+# Large downloads are split into byte ranges fetched over parallel connections
+PARALLEL_DOWNLOAD_STREAMS = 4
+PARALLEL_DOWNLOAD_MIN_SIZE = 64 * 1024 * 1024  # Smaller files are not worth the extra requests
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MB per read/write keeps Python loop iterations and syscalls low
+
+
+_http_session = None
+_urllib_opener = None
 
 
-def download_file(url: str, destination: Path, progress_callback: Optional[Callable[[int, int], None]] = None):
+def _get_http_session():
+    """
+    Return the shared requests session, creating it on first use.
+    Uses requests instead of urllib to avoid SSL/firewall issues.
+    """
+    global _http_session
+    if _http_session is None:
+        # Import requests (bundled with Blender)
+        import requests
+        session = requests.Session()
+
+        # Try to import certifi for better SSL verification
+        try:
+            import certifi
+            session.verify = certifi.where()
+            print("Using certifi for SSL verification")
+        except ImportError:
+            print("Using default SSL verification")
+
+        _http_session = session
+    return _http_session
+
+
+def _get_urllib_opener():
+    """Return a urllib opener with a reusable SSL context (no global install_opener)."""
+    global _urllib_opener
+    if _urllib_opener is None:
+        import ssl
+        import urllib.request
+        try:
+            import certifi
+            context = ssl.create_default_context(cafile=certifi.where())
+        except ImportError:
+            context = ssl.create_default_context()
+        _urllib_opener = urllib.request.build_opener(urllib.request.HTTPSHandler(context=context))
+    return _urllib_opener
+
+
+def _print_download_progress(downloaded: int, total_size: int):
+    """Print a single-line download progress indicator."""
+    if total_size > 0:
+        percent = min(100, (downloaded / total_size) * 100)
+        mb_downloaded = downloaded / (1024 * 1024)
+        mb_total = total_size / (1024 * 1024)
+        sys.stdout.write(f"\rDownloading: {percent:.1f}% ({mb_downloaded:.1f}/{mb_total:.1f} MB)")
+        sys.stdout.flush()
+
+
+class _BackgroundWriter:
+    """
+    Write chunks to an open file on a dedicated thread, so reading the next chunk
+    from the network never waits on the previous disk write.
+    """
+
+    def __init__(self, f, max_pending: int = 16):
+        import queue
+        import threading
+
+        self._f = f
+        self._queue = queue.Queue(maxsize=max_pending)  # Bounded: reader blocks if disk falls behind
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                return
+            if self._error is None:
+                try:
+                    self._f.write(chunk)
+                except Exception as e:
+                    self._error = e
+
+    def write(self, chunk: bytes):
+        if self._error is not None:
+            raise self._error
+        self._queue.put(chunk)
+
+    def close(self, raise_errors: bool = True):
+        """
+        Flush all pending chunks and stop the thread. Re-raises any write error unless
+        raise_errors is False (used while another exception is already propagating).
+        """
+        self._queue.put(None)
+        self._thread.join()
+        if raise_errors and self._error is not None:
+            raise self._error
+
+
+def _probe_range_support(session, url: str):
+    """
+    Ask the server for the file size and whether it accepts byte-range requests.
+
+    Returns:
+        tuple: (final_url, total_size, accepts_ranges); final_url has redirects resolved
+    """
+    try:
+        response = session.head(url, allow_redirects=True, timeout=30)
+        response.raise_for_status()
+    except Exception as e:
+        print(f"Range probe failed, using single connection: {e}")
+        return url, 0, False
+
+    total_size = int(response.headers.get('Content-Length', 0))
+    accepts_ranges = response.headers.get('Accept-Ranges', '').lower() == 'bytes'
+    return response.url, total_size, accepts_ranges
+
+
+def _download_parallel(session, url: str, destination: Path, total_size: int, num_streams: int,
+                       progress_callback: Optional[Callable[[int, int], None]] = None):
+    """
+    Download a file as num_streams byte ranges in parallel, each written at its own offset.
+    requests.Session is not thread-safe, so each range gets its own session configured like
+    the given one (same CA bundle and headers).
+    """
+    import threading
+    import requests
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+
+    # Preallocate so every worker can seek to its own range
+    with open(destination, 'wb') as f:
+        f.truncate(total_size)
+
+    downloaded = 0
+    lock = threading.Lock()
+    failed = threading.Event()  # Stops the remaining workers once one of them fails
+
+    def fetch_range(start: int, end: int):
+        nonlocal downloaded
+        headers = {'Range': f'bytes={start}-{end}'}
+        with requests.Session() as range_session:
+            range_session.verify = session.verify
+            range_session.headers.update(session.headers)
+            with range_session.get(url, headers=headers, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise RuntimeError(f"Server ignored range request (HTTP {response.status_code})")
+
+                with open(destination, 'r+b') as f:
+                    f.seek(start)
+                    # iter_content with a fixed chunk_size never yields empty chunks
+                    write = f.write
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        if failed.is_set():
+                            return
+                        write(chunk)
+                        with lock:
+                            downloaded += len(chunk)
+
+    bounds = [(i * total_size // num_streams, (i + 1) * total_size // num_streams - 1) for i in range(num_streams)]
+    print(f"Using {num_streams} parallel connections")
+
+    with ThreadPoolExecutor(max_workers=num_streams) as executor:
+        futures = [executor.submit(fetch_range, start, end) for start, end in bounds]
+
+        # Report progress from this thread while the workers download
+        pending = futures
+        while pending:
+            done, pending = wait(pending, timeout=0.5, return_when=FIRST_EXCEPTION)
+            if progress_callback:
+                progress_callback(downloaded, total_size)
+            _print_download_progress(downloaded, total_size)
+            if any(future.exception() for future in done):
+                failed.set()
+                break
+
+        for future in futures:
+            future.result()  # Re-raise the first worker error
+
+    if downloaded != total_size:
+        raise RuntimeError(f"Incomplete download: {downloaded} of {total_size} bytes")
+
+
+def _sha256_file(path: Path) -> str:
+    """Hash a file on disk (hashlib.file_digest where available, else 1 MB blocks)."""
+    import hashlib
+    with open(path, 'rb') as f:
+        # Python 3.11+: hashes straight from the file descriptor without Python-level reads
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        hasher = hashlib.sha256()
+        while True:
+            block = f.read(DOWNLOAD_CHUNK_SIZE)
+            if not block:
+                break
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def _check_sha256(actual: str, expected: str):
+    """Raise if a downloaded file's digest does not match the expected one."""
+    if actual.lower() != expected.lower():
+        raise ValueError(f"SHA-256 mismatch: expected {expected}, got {actual}")
+    print("SHA-256 verified")
+
+
+def download_file(url: str, destination: Path, progress_callback: Optional[Callable[[int, int], None]] = None,
+                  num_streams: int = PARALLEL_DOWNLOAD_STREAMS, expected_sha256: Optional[str] = None):
     """
     Download a file with progress tracking using requests library.
     Uses requests instead of urllib to avoid SSL/firewall issues.
+    Large files are fetched over several connections when the server supports range requests.
 
     Args:
         url: URL to download from
         destination: Path to save file to
         progress_callback: Optional callback(downloaded_bytes, total_bytes)
+        num_streams: Number of parallel connections for large files (1 disables splitting)
+        expected_sha256: Optional hex digest; the file is deleted and an error raised on mismatch
     """
+    import hashlib
+    import time
     destination.parent.mkdir(parents=True, exist_ok=True)
 
     print(f"Downloading: {url}")
     print(f"Destination: {destination}")
 
     try:
-        # Import requests (bundled with Blender)
-        import requests
+        # Shared session: connections and the CA bundle are reused across downloads
+        session = _get_http_session()
         print("Using requests library for download")
 
-        # Try to import certifi for better SSL verification
-        try:
-            import certifi
-            verify_ssl = certifi.where()
-            print("Using certifi for SSL verification")
-        except ImportError:
-            verify_ssl = True  # Use default verification
-            print("Using default SSL verification")
+        # Split large files into parallel range requests when the server allows it
+        if num_streams > 1:
+            final_url, total_size, accepts_ranges = _probe_range_support(session, url)
+            if accepts_ranges and total_size >= PARALLEL_DOWNLOAD_MIN_SIZE:
+                _download_parallel(session, final_url, destination, total_size, num_streams, progress_callback)
+                print("\nDownload complete!")
+                # Ranges arrive out of order, so hash the assembled file afterwards
+                if expected_sha256:
+                    _check_sha256(_sha256_file(destination), expected_sha256)
+                return True
 
         # Stream download to handle large files
-        with requests.get(url, stream=True, verify=verify_ssl, timeout=30) as response:
+        with session.get(url, stream=True, timeout=30) as response:
             response.raise_for_status()
 
             # Get total file size
             total_size = int(response.headers.get('Content-Length', 0))
             downloaded = 0
-            block_size = 8192  # 8KB chunks
+            hasher = hashlib.sha256() if expected_sha256 else None  # Hashed as the stream arrives
+            last_percent = -1
+            last_report_time = time.monotonic()
 
-            # Download in chunks and write to file
+            # Download in chunks; disk writes happen on a writer thread
             with open(destination, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=block_size):
-                    if chunk:  # filter out keep-alive new chunks
-                        f.write(chunk)
+                writer = _BackgroundWriter(f)
+                # Bind per-chunk calls once; iter_content with a fixed chunk_size never yields empty chunks
+                write = writer.write
+                update_hash = hasher.update if hasher else None
+                monotonic = time.monotonic
+                try:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        write(chunk)
+                        if update_hash:
+                            update_hash(chunk)
                         downloaded += len(chunk)
 
-                        # Report progress
-                        if progress_callback:
-                            progress_callback(downloaded, total_size)
-
-                        if total_size > 0:
-                            percent = min(100, (downloaded / total_size) * 100)
-                            mb_downloaded = downloaded / (1024 * 1024)
-                            mb_total = total_size / (1024 * 1024)
-                            print(f"\rDownloading: {percent:.1f}% ({mb_downloaded:.1f}/{mb_total:.1f} MB)", end='')
+                        # Report progress only when the whole percentage changes or every 0.5 s
+                        percent = downloaded * 100 // total_size if total_size > 0 else -1
+                        now = monotonic()
+                        if percent != last_percent or now - last_report_time >= 0.5:
+                            last_percent = percent
+                            last_report_time = now
+                            if progress_callback:
+                                progress_callback(downloaded, total_size)
+                            _print_download_progress(downloaded, total_size)
+                except BaseException:
+                    # Drain without raising, so a write error cannot mask the network error
+                    writer.close(raise_errors=False)
+                    raise
+                writer.close()
 
         print("\nDownload complete!")
+        if hasher:
+            _check_sha256(hasher.hexdigest(), expected_sha256)
         return True
 
     except ImportError:
         print("Error: requests library not found in Blender")
         print("Falling back to basic download without progress...")
         # Fallback: simple download without progress tracking
-        import urllib.request
         try:
-            urllib.request.urlretrieve(url, destination)
+            hasher = hashlib.sha256() if expected_sha256 else None
+            with _get_urllib_opener().open(url) as response, open(destination, 'wb') as f:
+                while True:
+                    chunk = response.read(DOWNLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    if hasher:
+                        hasher.update(chunk)
             print("Download complete!")
+            if hasher:
+                _check_sha256(hasher.hexdigest(), expected_sha256)
             return True
         except Exception as e:
             print(f"Download failed: {e}")
@@ -114,14 +368,86 @@ def download_file(url: str, destination: Path, progress_callback: Optional[Calla
         raise
 
 
-def install_python_windows(progress_callback: Optional[Callable[[str], None]] = None):
+def _extract_zip_parallel(zip_path: Path, target_dir: Path, max_workers: Optional[int] = None):
     """
-    Install embeddable Python for Windows.
-    First tries to use bundled Python (from GitHub repo), then downloads if needed.
+    Extract a zip archive with members inflated concurrently.
+    Each worker thread reads through its own ZipFile handle (a shared handle is not thread-safe).
 
     Args:
-        progress_callback: Optional callback for status updates
+        zip_path: Archive to extract
+        target_dir: Directory to extract into
+        max_workers: Number of extraction threads (defaults to the CPU count)
+    """
+    import shutil
+    import threading
+    import zipfile
+    from concurrent.futures import ThreadPoolExecutor
+
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        infos = zip_ref.infolist()
+
+    # Create every directory up front so workers never race on makedirs
+    target_dir = Path(target_dir).resolve()
+    members = []
+    for info in infos:
+        member_path = (target_dir / info.filename).resolve()
+        if member_path != target_dir and target_dir not in member_path.parents:
+            raise ValueError(f"Zip member escapes target directory: {info.filename}")
+        if info.is_dir():
+            member_path.mkdir(parents=True, exist_ok=True)
+        else:
+            member_path.parent.mkdir(parents=True, exist_ok=True)
+            members.append((info, member_path))
+
+    local = threading.local()
+    handles = []
+    handles_lock = threading.Lock()
+
+    def extract_one(member):
+        info, member_path = member
+        zip_handle = getattr(local, 'zip_handle', None)
+        if zip_handle is None:
+            zip_handle = local.zip_handle = zipfile.ZipFile(zip_path, 'r')
+            with handles_lock:
+                handles.append(zip_handle)
+        # Stream the member with a 1 MB buffer rather than extract()'s default copy size
+        with zip_handle.open(info) as src, open(member_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            list(executor.map(extract_one, members))
+    finally:
+        for zip_handle in handles:
+            zip_handle.close()
+
+
+def _extract_tar_zst(archive_path: Path, target_dir: Path) -> bool:
     """
+    Extract a .tar.zst archive in one streaming pass (no temporary .tar file).
+
+    Returns:
+        bool: True if extracted, False if the zstandard module is not available
+    """
+    try:
+        import zstandard
+    except ImportError:
+        return False
+    import tarfile
+
+    with open(archive_path, 'rb') as f:
+        with zstandard.ZstdDecompressor().stream_reader(f) as reader:
+            with tarfile.open(fileobj=reader, mode='r|') as tar:
+                # Reject absolute paths and links outside target_dir where supported
+                if hasattr(tarfile, 'data_filter'):
+                    tar.extractall(target_dir, filter='data')
+                else:
+                    tar.extractall(target_dir)
+    return True
+
+
+def _install_python_from_zip(progress_callback: Optional[Callable[[str], None]] = None):
+    """Extract the bundled embeddable Python zip, downloading it first if it is not bundled."""
     # Check if Python is bundled in the repo
     if BUNDLED_PYTHON_ZIP.exists():
         if progress_callback:
@@ -144,23 +470,89 @@ def install_python_windows(progress_callback: Optional[Callable[[str], None]] =
 
     # Extract to Env directory
     MLSHARP_ENV_DIR.mkdir(parents=True, exist_ok=True)
-    with zipfile.ZipFile(python_zip, 'r') as zip_ref:
-        zip_ref.extractall(MLSHARP_ENV_DIR)
+    _extract_zip_parallel(python_zip, MLSHARP_ENV_DIR)
 
     # Clean up zip only if we downloaded it
     if cleanup_zip:
         python_zip.unlink()
 
+
+def _archive_file_id(path: Path) -> str:
+    """Name, size and mtime of an archive: changes when the bundled file is replaced, no hashing."""
+    st = path.stat()
+    return f"{path.name}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def _python_archive_id() -> str:
+    """
+    Identify the archive install_python_windows extracts: the bundled .tar.zst (when zstandard
+    can read it), else the bundled zip, else the download URL. Cheap enough for status checks.
+    """
+    import importlib.util
+    if BUNDLED_PYTHON_TAR_ZST.exists() and importlib.util.find_spec('zstandard') is not None:
+        return _archive_file_id(BUNDLED_PYTHON_TAR_ZST)
+    if BUNDLED_PYTHON_ZIP.exists():
+        return _archive_file_id(BUNDLED_PYTHON_ZIP)
+    return PYTHON_DOWNLOADS['win32']
+
+
+def _is_python_extracted(archive_id: str) -> bool:
+    """
+    Check for a finished extraction of the same archive. A partial extraction has no stamp and
+    an updated bundled archive changes the id, so check_environment_status reports both as not installed.
+    """
+    if not (MLSHARP_ENV_DIR / "python.exe").exists() or not (MLSHARP_ENV_DIR / "python313._pth").exists():
+        return False
+    try:
+        return PYTHON_INSTALL_STAMP.read_text(encoding='utf-8').strip() == archive_id
+    except OSError:
+        return False
+
+
+def install_python_windows(progress_callback: Optional[Callable[[str], None]] = None):
+    """
+    Install embeddable Python for Windows.
+    First tries to use bundled Python (from GitHub repo), then downloads if needed.
+
+    Args:
+        progress_callback: Optional callback for status updates
+    """
+    # Called when check_environment_status finds no stamped extraction of the current archive
+    # Prefer the zstd tarball when bundled: it decompresses faster than the deflate zip
+    extracted = False
+    if BUNDLED_PYTHON_TAR_ZST.exists():
+        if progress_callback:
+            progress_callback("Extracting bundled Python 3.13 (no download needed)...")
+        print(f"Found bundled Python at: {BUNDLED_PYTHON_TAR_ZST}")
+        MLSHARP_ENV_DIR.mkdir(parents=True, exist_ok=True)
+        extracted = _extract_tar_zst(BUNDLED_PYTHON_TAR_ZST, MLSHARP_ENV_DIR)
+        if not extracted:
+            print("zstandard not available, falling back to zip")
+
+    if extracted:
+        archive_id = _archive_file_id(BUNDLED_PYTHON_TAR_ZST)
+    else:
+        _install_python_from_zip(progress_callback)
+        archive_id = _archive_file_id(BUNDLED_PYTHON_ZIP) if BUNDLED_PYTHON_ZIP.exists() else PYTHON_DOWNLOADS['win32']
+
+    # Written last, so an interrupted extraction is redone by the next install
+    PYTHON_INSTALL_STAMP.write_text(archive_id, encoding='utf-8')
+
     # Modify python313._pth to enable pip and site-packages
     pth_file = MLSHARP_ENV_DIR / "python313._pth"
     if pth_file.exists():
-        content = pth_file.read_text()
-        # Uncomment 'import site' line if it exists
-        content = content.replace('#import site', 'import site')
-        # Add Lib/site-packages if not present
-        if 'Lib/site-packages' not in content:
-            content += '\nLib/site-packages\n'
-        pth_file.write_text(content)
+        with open(pth_file, 'r+', encoding='utf-8') as f:
+            content = f.read()
+            # Uncomment 'import site' line if it exists
+            new_content = content.replace('#import site', 'import site')
+            # Add Lib/site-packages if not present
+            if 'Lib/site-packages' not in new_content:
+                new_content += '\nLib/site-packages\n'
+            # Rewrite in place only if something changed (e.g. not on a re-install)
+            if new_content != content:
+                f.seek(0)
+                f.write(new_content)
+                f.truncate()
 
     if progress_callback:
         progress_callback("Python installation complete")
@@ -168,6 +560,53 @@ def install_python_windows(progress_callback: Optional[Callable[[str], None]] =
     return True
 
 
+def _write_console_lines(data: bytes):
+    """Write complete output lines to the console in one call, keeping only the last state of CR progress bars."""
+    lines = [line.rstrip(b'\r').rsplit(b'\r', 1)[-1] for line in data.split(b'\n')]
+    output = b'\n'.join(lines) + b'\n'
+    console = getattr(sys.stdout, 'buffer', None)
+    if console is not None:
+        # Pass the child's bytes straight through; no decode/encode round-trip
+        sys.stdout.flush()
+        console.write(output)
+        console.flush()
+    else:
+        sys.stdout.write(output.decode('utf-8', errors='replace'))
+        sys.stdout.flush()
+
+
+def _run_with_console_output(cmd) -> int:
+    """
+    Run a command and forward its combined stdout/stderr to the console.
+    Output is read from the raw pipe in 64 KB chunks and written once per chunk instead of once per line.
+
+    Returns:
+        int: Process exit code
+    """
+    import subprocess
+
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0)
+    # Leave Blender a core that pip does not compete for
+    set_process_affinity(process, background_cores())
+    fd = process.stdout.fileno()
+
+    pending = b''
+    while True:
+        data = os.read(fd, 65536)
+        if not data:
+            break
+        # Only emit complete lines; keep the partial tail for the next chunk
+        text, newline, pending = (pending + data).rpartition(b'\n')
+        if newline:
+            _write_console_lines(text)
+
+    process.stdout.close()
+    if pending:
+        _write_console_lines(pending)
+
+    return process.wait()
+
+
 def install_pip(python_exe: Path, progress_callback: Optional[Callable[[str], None]] = None):
     """
     Install pip into the embedded Python environment.
@@ -177,16 +616,17 @@ def install_pip(python_exe: Path, progress_callback: Optional[Callable[[str], No
         python_exe: Path to Python executable
         progress_callback: Optional callback for status updates
     """
+    import subprocess
+
     if progress_callback:
         progress_callback("Installing pip...")
 
     # Check if get-pip.py is bundled in the repo
     if BUNDLED_GET_PIP.exists():
         print(f"Found bundled get-pip.py at: {BUNDLED_GET_PIP}")
-        # Copy bundled file to Env directory
-        get_pip_path = MLSHARP_ENV_DIR / "get-pip.py"
-        shutil.copy(BUNDLED_GET_PIP, get_pip_path)
-        cleanup_pip = True  # Delete copy after use
+        # get-pip.py is self-contained, so run the bundled copy in place
+        get_pip_path = BUNDLED_GET_PIP
+        cleanup_pip = False  # Don't delete bundled file
     else:
         # Download get-pip.py
         get_pip_url = "https://bootstrap.pypa.io/get-pip.py"
@@ -209,7 +649,7 @@ def install_pip(python_exe: Path, progress_callback: Optional[Callable[[str], No
         print(f"pip installation errors: {result.stderr}")
         raise RuntimeError(f"Failed to install pip: {result.stderr}")
 
-    # Clean up copy
+    # Clean up download
     if cleanup_pip and get_pip_path.exists():
         get_pip_path.unlink()
 
@@ -231,6 +671,8 @@ def upgrade_pip_and_build_tools(python_exe: Path, progress_callback: Optional[Ca
         python_exe: Path to Python executable
         progress_callback: Optional callback for status updates
     """
+    import subprocess
+
     if progress_callback:
         progress_callback("Installing pip and build tools at pinned versions...")
 
@@ -244,6 +686,7 @@ def upgrade_pip_and_build_tools(python_exe: Path, progress_callback: Optional[Ca
         "pip>=24.0",
         "setuptools==80.9.0",  # Exact version from requirements.txt
         "wheel>=0.44.0",
+        *PIP_INSTALL_OPTIONS,
         "--no-warn-script-location"
     ]
 
@@ -283,6 +726,18 @@ def upgrade_pip_and_build_tools(python_exe: Path, progress_callback: Optional[Ca
     return True
 
 
+def _package_install_options() -> list:
+    """
+    pip options for the large package installs (PyTorch and requirements.txt).
+    Skips byte-compiling the installed files (Python compiles them lazily on first import)
+    and adds the bundled wheels folder as a local source if it exists.
+    """
+    options = [*PIP_INSTALL_OPTIONS, "--no-compile"]
+    if BUNDLED_WHEELS_DIR.is_dir():
+        options += ["--find-links", str(BUNDLED_WHEELS_DIR)]
+    return options
+
+
 def install_pytorch_cuda_windows(python_exe: Path, progress_callback: Optional[Callable[[str], None]] = None):
     """
     Install PyTorch with CUDA support on Windows.
@@ -307,28 +762,16 @@ def install_pytorch_cuda_windows(python_exe: Path, progress_callback: Optional[C
         "torch==2.8.0",
         "torchvision==0.23.0",
         "--index-url", "https://download.pytorch.org/whl/cu128",
+        *_package_install_options(),
         "--no-warn-script-location"
     ]
 
     print(f"Running: {' '.join(cmd)}")
 
-    process = subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        encoding='utf-8',
-        errors='replace',  # Replace invalid UTF-8 bytes instead of crashing
-        bufsize=1,
-        universal_newlines=True
-    )
+    returncode = _run_with_console_output(cmd)
 
-    for line in process.stdout:
-        print(line.rstrip())
-
-    process.wait()
-
-    if process.returncode != 0:
-        raise RuntimeError(f"Failed to install PyTorch with CUDA. Exit code: {process.returncode}")
+    if returncode != 0:
+        raise RuntimeError(f"Failed to install PyTorch with CUDA. Exit code: {returncode}")
 
     if progress_callback:
         progress_callback("PyTorch with CUDA installed successfully")
@@ -336,6 +779,32 @@ def install_pytorch_cuda_windows(python_exe: Path, progress_callback: Optional[C
     return True
 
 
+# Installed separately with CUDA on Windows
+REQUIREMENTS_SKIP_PACKAGES = ('torch', 'torchvision')
+
+
+def _iter_install_requirements(lines):
+    """
+    Filter requirements.txt lines in a single pass.
+    Yields each line pip should install, and None for each line that was dropped.
+    """
+    for line in lines:
+        stripped = line.strip()
+        # Skip editable installs (-e), empty lines, comment-only lines and uv metadata
+        if not stripped or stripped.startswith(('-e', '#', 'via')):
+            yield None
+            continue
+
+        # Skip torch/torchvision (handled separately)
+        package_name = stripped.split('==')[0].split(';')[0].strip()
+        if package_name in REQUIREMENTS_SKIP_PACKAGES:
+            print(f"Skipping {package_name} (installed separately with CUDA)")
+            yield None
+            continue
+
+        yield line
+
+
 def install_requirements(python_exe: Path, requirements_file: Path, progress_callback: Optional[Callable[[str], None]] = None):
     """
     Install Python packages from requirements.txt using pip.
@@ -353,36 +822,23 @@ def install_requirements(python_exe: Path, requirements_file: Path, progress_cal
 
     print(f"Installing packages from: {requirements_file}")
 
-    # Read requirements and filter out problematic lines
-    # The sharp package is already available via PYTHONPATH (ml-sharp/src)
+    # Filter out problematic lines while copying into a temporary requirements file
+    # The sharp package is imported from ml-sharp/src (added to sys.path by the launcher and worker)
     # so we don't need to install it via pip
-    with open(requirements_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
-    # Filter out editable install lines, comments-only lines, and packages we handle separately
-    filtered_lines = []
-    packages_to_skip = ['torch', 'torchvision']  # Installed separately with CUDA on Windows
-
-    for line in lines:
-        stripped = line.strip()
-        # Skip editable installs (-e), empty lines, and comment-only lines
-        if stripped and not stripped.startswith('-e') and not stripped.startswith('#'):
-            # Skip torch/torchvision (handled separately) and uv metadata
-            if not stripped.startswith('via'):
-                # Check if line starts with a package we want to skip
-                package_name = stripped.split('==')[0].split(';')[0].strip()
-                if package_name not in packages_to_skip:
-                    filtered_lines.append(line)
-                else:
-                    print(f"Skipping {package_name} (installed separately with CUDA)")
-
-    # Create temporary filtered requirements file
+    # (pip cannot read a requirements file from stdin on Windows, so a file is still needed)
     temp_requirements = MLSHARP_ENV_DIR / "requirements_filtered.txt"
-    with open(temp_requirements, 'w', encoding='utf-8') as f:
-        f.writelines(filtered_lines)
+    original_count = 0
+    filtered_count = 0
+
+    with open(requirements_file, 'r', encoding='utf-8') as src, open(temp_requirements, 'w', encoding='utf-8') as dst:
+        for line in _iter_install_requirements(src):
+            original_count += 1
+            if line is not None:
+                filtered_count += 1
+                dst.write(line)
 
     print(f"Filtered requirements (removed editable installs and torch packages):")
-    print(f"Original lines: {len(lines)}, Filtered lines: {len(filtered_lines)}")
+    print(f"Original lines: {original_count}, Filtered lines: {filtered_count}")
 
     # Install packages using pip
     cmd = [
@@ -390,34 +846,21 @@ def install_requirements(python_exe: Path, requirements_file: Path, progress_cal
         "-m", "pip",
         "install",
         "-r", str(temp_requirements),
+        *_package_install_options(),
         "--no-warn-script-location"
     ]
 
     print(f"Running: {' '.join(cmd)}")
 
     # Run with real-time output
-    process = subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        encoding='utf-8',
-        errors='replace',  # Replace invalid UTF-8 bytes instead of crashing
-        bufsize=1,
-        universal_newlines=True
-    )
-
-    # Print output in real-time
-    for line in process.stdout:
-        print(line.rstrip())
-
-    process.wait()
+    returncode = _run_with_console_output(cmd)
 
     # Clean up temporary file
     if temp_requirements.exists():
         temp_requirements.unlink()
 
-    if process.returncode != 0:
-        raise RuntimeError(f"Failed to install requirements. Exit code: {process.returncode}")
+    if returncode != 0:
+        raise RuntimeError(f"Failed to install requirements. Exit code: {returncode}")
 
     if progress_callback:
         progress_callback("All packages installed successfully")
@@ -425,6 +868,44 @@ def install_requirements(python_exe: Path, requirements_file: Path, progress_cal
     return True
 
 
+def _checkpoint_stamp(checkpoint_path: Path) -> str:
+    """Identify the checkpoint file on disk together with the digest it is checked against."""
+    st = checkpoint_path.stat()
+    return f"{st.st_mtime_ns}-{st.st_size}-{CHECKPOINT_SHA256.lower()}"
+
+
+def _mark_checkpoint_verified(checkpoint_path: Path):
+    """Record that the current checkpoint file matched CHECKPOINT_SHA256."""
+    try:
+        CHECKPOINT_VERIFIED_FILE.write_text(_checkpoint_stamp(checkpoint_path), encoding='utf-8')
+    except OSError as e:
+        print(f"Could not record checkpoint verification: {e}")
+
+
+def _is_checkpoint_verified(checkpoint_path: Path) -> bool:
+    """
+    Check the checkpoint against CHECKPOINT_SHA256, hashing only if the file changed
+    since the last successful check. Always True when no digest is configured.
+    """
+    if not CHECKPOINT_SHA256:
+        return True
+    try:
+        stamp = _checkpoint_stamp(checkpoint_path)
+        if CHECKPOINT_VERIFIED_FILE.read_text(encoding='utf-8') == stamp:
+            return True
+    except OSError:
+        pass
+
+    print(f"Verifying checkpoint SHA-256: {CHECKPOINT_FILENAME}")
+    try:
+        _check_sha256(_sha256_file(checkpoint_path), CHECKPOINT_SHA256)
+    except (OSError, ValueError) as e:
+        print(f"Checkpoint verification failed: {e}")
+        return False
+    _mark_checkpoint_verified(checkpoint_path)
+    return True
+
+
 def download_checkpoint(progress_callback: Optional[Callable[[str], None]] = None):
     """
     Download ML-Sharp checkpoint file.
@@ -434,15 +915,22 @@ def download_checkpoint(progress_callback: Optional[Callable[[str], None]] = Non
     """
     checkpoint_path = MLSHARP_DIR / CHECKPOINT_FILENAME
 
-    if checkpoint_path.exists():
+    if is_checkpoint_complete() and _is_checkpoint_verified(checkpoint_path):
         if progress_callback:
             progress_callback(f"Checkpoint already exists: {CHECKPOINT_FILENAME}")
         return checkpoint_path
 
+    # Truncated or corrupted file from an earlier attempt: start over
+    if checkpoint_path.exists():
+        print(f"Existing checkpoint is incomplete or corrupted, re-downloading: {CHECKPOINT_FILENAME}")
+        checkpoint_path.unlink()
+
     if progress_callback:
         progress_callback("Downloading ML-Sharp checkpoint (~1.5GB)...")
 
-    download_file(CHECKPOINT_URL, checkpoint_path)
+    download_file(CHECKPOINT_URL, checkpoint_path, expected_sha256=CHECKPOINT_SHA256)
+    if CHECKPOINT_SHA256:
+        _mark_checkpoint_verified(checkpoint_path)
 
     if progress_callback:
         progress_callback("Checkpoint downloaded successfully")
@@ -450,23 +938,42 @@ def download_checkpoint(progress_callback: Optional[Callable[[str], None]] = Non
     return checkpoint_path
 
 
-def is_checkpoint_complete() -> bool:
+def _dir_entries(directory: Path) -> dict:
+    """
+    List a directory once and index it by name.
+    On Windows, DirEntry.stat() is served from the directory listing without another syscall.
+
+    Returns:
+        dict: name -> os.DirEntry (empty if the directory is missing)
+    """
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
+
+
+def is_checkpoint_complete(entries: Optional[dict] = None) -> bool:
     """
     Check if the checkpoint file is fully downloaded by validating both existence and file size.
 
+    Args:
+        entries: Optional result of _dir_entries(MLSHARP_DIR) to reuse an existing listing
+
     Returns:
         bool: True if checkpoint exists and has the expected file size, False otherwise
     """
-    checkpoint_path = MLSHARP_DIR / CHECKPOINT_FILENAME
+    if entries is None:
+        entries = _dir_entries(MLSHARP_DIR)
 
     # First check if file exists
-    if not checkpoint_path.exists():
+    entry = entries.get(CHECKPOINT_FILENAME)
+    if entry is None:
         return False
 
     # Check if file size matches expected size (prevents false positive during download)
     try:
-        actual_size = checkpoint_path.stat().st_size
-        return actual_size == CHECKPOINT_EXPECTED_SIZE
+        return entry.is_file() and entry.stat().st_size == CHECKPOINT_EXPECTED_SIZE
     except OSError:
         # File might be locked or inaccessible during download
         return False
@@ -480,52 +987,98 @@ def get_python_executable() -> Optional[Path]:
         return MLSHARP_ENV_DIR / "bin" / "python"
 
 
-def check_environment_status():
+# Core dependencies whose presence marks the package install as complete
+# (distribution name and top-level import package are the same for both)
+REQUIRED_DISTRIBUTIONS = ('torch', 'gsplat')
+
+
+def get_site_packages_dir() -> Path:
+    """Get the site-packages directory of the ML-Sharp environment."""
+    if os.name == 'nt':  # Windows (embeddable layout)
+        return MLSHARP_ENV_DIR / "Lib" / "site-packages"
+    lib_dirs = sorted((MLSHARP_ENV_DIR / "lib").glob("python3*"))
+    if lib_dirs:
+        return lib_dirs[-1] / "site-packages"
+    return MLSHARP_ENV_DIR / "lib" / "site-packages"
+
+
+def _installed_distributions(site_packages: Path) -> dict:
+    """
+    Read installed distributions from the *.dist-info folder names in one directory listing.
+
+    Returns:
+        dict: lower-case distribution name -> version string
+    """
+    distributions = {}
+    for name in _dir_entries(site_packages):
+        if name.endswith('.dist-info'):
+            dist_name, _, version = name[:-len('.dist-info')].partition('-')
+            distributions[dist_name.lower()] = version
+    return distributions
+
+
+def check_environment_status(verify_imports: bool = False):
     """
     Check the status of the ML-Sharp environment.
 
+    Args:
+        verify_imports: Also import torch/gsplat in the embedded interpreter to catch
+            broken installs (slow: starts Python and loads torch)
+
     Returns:
         dict: Status with keys 'python_installed', 'packages_installed', 'checkpoint_exists'
     """
     python_exe = get_python_executable()
 
+    # One directory listing each for the interpreter and the checkpoint instead of per-file stats
+    python_installed = bool(python_exe) and python_exe.name in _dir_entries(python_exe.parent)
+    if python_installed and os.name == 'nt':
+        # The embeddable Python is extracted by install_python_windows, which stamps a complete
+        # extraction; a missing or stale stamp means a partial or outdated Env to re-extract
+        python_installed = _is_python_extracted(_python_archive_id())
+
     status = {
-        'python_installed': python_exe.exists() if python_exe else False,
+        'python_installed': python_installed,
         'packages_installed': False,
-        'checkpoint_exists': is_checkpoint_complete(),
+        'checkpoint_exists': is_checkpoint_complete(_dir_entries(MLSHARP_DIR)),
         'python_path': str(python_exe) if python_exe else "Unknown",
     }
 
-    # Check if packages are installed by trying to import core dependencies
+    # Check if core dependencies are installed from their pip metadata
     # Note: We don't check for 'sharp' here because it's not installed via pip,
-    # it's loaded from ml-sharp/src/ via PYTHONPATH at runtime
+    # it's loaded from ml-sharp/src/, which the launcher and worker add to sys.path at runtime
+    if status['python_installed'] and not verify_imports:
+        site_packages = get_site_packages_dir()
+        distributions = _installed_distributions(site_packages)
+        # Metadata alone can outlive a broken install, so also stat each package's __init__.py
+        status['packages_installed'] = all(
+            name in distributions and (site_packages / name / "__init__.py").is_file()
+            for name in REQUIRED_DISTRIBUTIONS
+        )
+        if status['packages_installed']:
+            # CUDA wheels carry a local version tag such as 2.8.0+cu128
+            status['cuda_available'] = '+cu' in distributions['torch']
+        return status
+
+    # Import check in the embedded interpreter
     if status['python_installed']:
+        import subprocess
         try:
-            # Check for core dependencies (torch and gsplat are the main ones)
+            # Check for core dependencies (torch and gsplat are the main ones) and
+            # CUDA availability in one interpreter, so torch is only imported once
             # Note: torch can take 20+ seconds to import the first time, especially with CUDA
             result = subprocess.run(
-                [str(python_exe), "-c", "import torch; import gsplat; print('OK')"],
+                [str(python_exe), "-c",
+                 "import torch; import gsplat; print('OK', 'CUDA' if torch.cuda.is_available() else 'CPU')"],
                 capture_output=True,
                 text=True,
                 timeout=30  # Increased from 10 to 30 seconds for first-time import
             )
             status['packages_installed'] = (result.returncode == 0 and 'OK' in result.stdout)
 
-            # Check CUDA availability (optional - just for info)
+            # CUDA availability (optional - just for info)
             if status['packages_installed']:
-                try:
-                    cuda_check = subprocess.run(
-                        [str(python_exe), "-c", "import torch; print('CUDA' if torch.cuda.is_available() else 'CPU')"],
-                        capture_output=True,
-                        text=True,
-                        timeout=30  # Increased from 10 to 30 seconds for first-time import
-                    )
-                    if cuda_check.returncode == 0:
-                        status['cuda_available'] = 'CUDA' in cuda_check.stdout
-                    else:
-                        status['cuda_available'] = False
-                except Exception:
-                    status['cuda_available'] = False
+                status['cuda_available'] = 'CUDA' in result.stdout
         except Exception as e:
             print(f"Package check failed: {e}")
             status['packages_installed'] = False
@@ -543,54 +1096,67 @@ def install_environment_windows(progress_callback: Optional[Callable[[str], None
     Returns:
         bool: True if successful
     """
+    from concurrent.futures import ThreadPoolExecutor
+
     try:
         # Check current status
         status = check_environment_status()
 
-        # Step 1: Install Python if needed
-        if not status['python_installed']:
-            if progress_callback:
-                progress_callback("Step 1/3: Installing Python...")
-            install_python_windows(progress_callback)
-        else:
-            if progress_callback:
-                progress_callback("Step 1/3: Python already installed")
-
-        python_exe = get_python_executable()
-
-        # Step 2: Install pip and packages
-        if not status['packages_installed']:
-            if progress_callback:
-                progress_callback("Step 2/3: Installing pip...")
-            install_pip(python_exe, progress_callback)
-
-            # Upgrade pip and build tools to pinned versions (critical for PyTorch compatibility)
-            if progress_callback:
-                progress_callback("Step 2/3: Upgrading pip and build tools...")
-            upgrade_pip_and_build_tools(python_exe, progress_callback)
-
-            # Install PyTorch with CUDA support (Windows-specific)
-            if progress_callback:
-                progress_callback("Step 2/3: Installing PyTorch with CUDA...")
-            install_pytorch_cuda_windows(python_exe, progress_callback)
-
-            # Then install remaining packages from requirements.txt
-            if progress_callback:
-                progress_callback("Step 2/3: Installing remaining packages...")
-            requirements_file = MLSHARP_DIR / "requirements.txt"
-            install_requirements(python_exe, requirements_file, progress_callback)
-        else:
-            if progress_callback:
-                progress_callback("Step 2/3: Packages already installed")
-
-        # Step 3: Download checkpoint
-        if not status['checkpoint_exists']:
-            if progress_callback:
-                progress_callback("Step 3/3: Downloading checkpoint...")
-            download_checkpoint(progress_callback)
-        else:
-            if progress_callback:
-                progress_callback("Step 3/3: Checkpoint already exists")
+        # The checkpoint download is network-bound and independent of the Python/pip steps,
+        # so run it on a background thread while they proceed (progress_callback is thread-safe)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            checkpoint_future = None
+            if not status['checkpoint_exists']:
+                if progress_callback:
+                    progress_callback("Step 3/3: Downloading checkpoint in the background...")
+                checkpoint_future = executor.submit(download_checkpoint, progress_callback)
+
+            # Step 1: Install Python if needed
+            if not status['python_installed']:
+                if progress_callback:
+                    progress_callback("Step 1/3: Installing Python...")
+                install_python_windows(progress_callback)
+            else:
+                if progress_callback:
+                    progress_callback("Step 1/3: Python already installed")
+
+            python_exe = get_python_executable()
+
+            # Step 2: Install pip and packages
+            if not status['packages_installed']:
+                if progress_callback:
+                    progress_callback("Step 2/3: Installing pip...")
+                install_pip(python_exe, progress_callback)
+
+                # Upgrade pip and build tools to pinned versions (critical for PyTorch compatibility)
+                if progress_callback:
+                    progress_callback("Step 2/3: Upgrading pip and build tools...")
+                upgrade_pip_and_build_tools(python_exe, progress_callback)
+
+                # Install PyTorch with CUDA support (Windows-specific)
+                if progress_callback:
+                    progress_callback("Step 2/3: Installing PyTorch with CUDA...")
+                install_pytorch_cuda_windows(python_exe, progress_callback)
+
+                # Then install remaining packages from requirements.txt
+                if progress_callback:
+                    progress_callback("Step 2/3: Installing remaining packages...")
+                requirements_file = MLSHARP_DIR / "requirements.txt"
+                install_requirements(python_exe, requirements_file, progress_callback)
+            else:
+                if progress_callback:
+                    progress_callback("Step 2/3: Packages already installed")
+
+            # Step 3: Wait for the checkpoint download (re-raises its error, if any)
+            # If an earlier step raised, leaving the with-block still waits for the
+            # download so a retry never races a half-written checkpoint
+            if checkpoint_future is not None:
+                if not checkpoint_future.done() and progress_callback:
+                    progress_callback("Step 3/3: Waiting for checkpoint download...")
+                checkpoint_future.result()
+            else:
+                if progress_callback:
+                    progress_callback("Step 3/3: Checkpoint already exists")
 
         if progress_callback:
             progress_callback("Installation complete!")
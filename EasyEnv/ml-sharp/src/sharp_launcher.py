@@ -0,0 +1,37 @@
+"""
+One-shot `sharp` CLI launcher for ml-sharp's embedded Python, used by
+predict_gaussians_from_image(persistent=False) in sharp_wrapper.py.
+
+    python sharp_launcher.py [--standardize <output.ply>] <sharp CLI arguments>
+
+With --standardize, the given PLY is converted to the industry-standard
+layout in the same process once the CLI has succeeded.
+"""
+
+import os
+import sys
+
+# The embeddable Python ignores PYTHONPATH and the script directory (._pth file)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def main(argv):
+    standardize = None
+    if argv[:1] == ["--standardize"]:
+        standardize, argv = argv[1], argv[2:]
+
+    from sharp.cli import main_cli
+    try:
+        main_cli(args=argv, prog_name="sharp")
+    except SystemExit as e:
+        if e.code:
+            raise
+
+    if standardize:
+        from sharp_postprocess import standardize_in_place
+        standardize_in_place(standardize, verbose="-v" in argv)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,277 @@
+"""
+Post-processing for ML-Sharp output, run inside ml-sharp's embedded Python.
+Converts the PLY written by `sharp predict` to the industry-standard 3DGS
+layout and writes a matching .splat file next to it.
+
+Imported by the predict invocation in sharp_wrapper.py so prediction and
+standardization share one interpreter; also runnable as a script:
+
+    python sharp_postprocess.py <input.ply> <output.ply.tmp> [-v]
+"""
+
+import os
+import sys
+import numpy as np
+from plyfile import PlyData
+
+
+# PLY scalar type names -> NumPy type codes
+PLY_TYPES = {
+    'char': 'i1', 'int8': 'i1', 'uchar': 'u1', 'uint8': 'u1',
+    'short': 'i2', 'int16': 'i2', 'ushort': 'u2', 'uint16': 'u2',
+    'int': 'i4', 'int32': 'i4', 'uint': 'u4', 'uint32': 'u4',
+    'float': 'f4', 'float32': 'f4', 'double': 'f8', 'float64': 'f8',
+}
+
+
+def read_ply_header(path):
+    """Parse the ASCII header: (format, [(element, count, properties)], header size).
+
+    List properties are recorded with a None type.
+    """
+    fmt = None
+    elements = []
+    with open(path, 'rb') as f:
+        if f.readline().strip() != b'ply':
+            raise ValueError("Not a PLY file")
+        while True:
+            line = f.readline()
+            if not line:
+                raise ValueError("PLY header has no end_header")
+            words = line.decode('ascii').split()
+            if not words:
+                continue
+            if words[0] == 'end_header':
+                return fmt, elements, f.tell()
+            if words[0] == 'format':
+                fmt = words[1]
+            elif words[0] == 'element':
+                elements.append((words[1], int(words[2]), []))
+            elif words[0] == 'property' and elements:
+                if words[1] == 'list':
+                    elements[-1][2].append((words[-1], None))
+                else:
+                    elements[-1][2].append((words[2], words[1]))
+
+
+def read_vertex_data(path):
+    """Return the vertex element as a structured array, or None if there is none.
+
+    Binary little-endian files (what ML-Sharp writes) are memory-mapped straight
+    from disk; anything else goes through plyfile.
+    """
+    fmt, elements, offset = read_ply_header(path)
+    if fmt == 'binary_little_endian':
+        for name, count, props in elements:
+            if any(ply_type is None or ply_type not in PLY_TYPES for _, ply_type in props):
+                break  # Variable-size rows: the vertex offset is unknown
+            dtype = np.dtype([(prop, '<' + PLY_TYPES[ply_type]) for prop, ply_type in props])
+            if name == 'vertex':
+                if count == 0:
+                    return np.empty(0, dtype=dtype)
+                return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(count,))
+            offset += count * dtype.itemsize
+        else:
+            return None
+
+    plydata = PlyData.read(path)
+    if 'vertex' not in plydata:
+        return None
+    return plydata['vertex'].data
+
+
+def write_vertex_ply(data, output_path):
+    """Write a binary little-endian PLY holding only a vertex element.
+
+    All properties of the standard layout are '<f4', so the records are
+    already in on-disk byte order and go out as one bulk write.
+    """
+    types = {code: name for name, code in PLY_TYPES.items() if not name[-1].isdigit()}
+    header = ['ply', 'format binary_little_endian 1.0', f'element vertex {len(data)}']
+    for name in data.dtype.names:
+        header.append(f'property {types[data.dtype.fields[name][0].str[1:]]} {name}')
+    header.append('end_header\n')
+
+    with open(output_path, 'wb') as f:
+        f.write('\n'.join(header).encode('ascii'))
+        np.ascontiguousarray(data).tofile(f)
+
+
+def save_as_splat(data, output_path):
+    """Save to 32-byte per splat binary format for Unity/Web."""
+    num_points = len(data)
+
+    # Packed 32-byte record; every field below is written straight into it
+    dtype_splat = np.dtype([
+        ('pos', np.float32, 3),
+        ('scale', np.float32, 3),
+        ('rgba', np.uint8, 4),
+        ('rot', np.uint8, 4)
+    ])
+    splat_data = np.empty(num_points, dtype=dtype_splat)
+    pos = splat_data['pos']
+    scale = splat_data['scale']
+    rgba = splat_data['rgba']
+    rot = splat_data['rot']
+
+    # 1. Position (x, y, z) - 12 bytes
+    for i, name in enumerate(('x', 'y', 'z')):
+        pos[:, i] = data[name]
+
+    # 2. Scale (exp conversion) - 12 bytes
+    for i, name in enumerate(('scale_0', 'scale_1', 'scale_2')):
+        scale[:, i] = data[name]
+    np.exp(scale, out=scale)
+
+    # 3. Color & Opacity (RGBA) - 4 bytes
+    SH_C0 = np.float32(0.28209479177387814)
+    channel = np.empty(num_points, dtype=np.float32)
+    for i, name in enumerate(('f_dc_0', 'f_dc_1', 'f_dc_2')):
+        np.multiply(data[name], SH_C0, out=channel)
+        channel += np.float32(0.5)
+        channel *= np.float32(255)
+        np.clip(channel, 0, 255, out=channel)
+        rgba[:, i] = channel
+    np.negative(data['opacity'], out=channel)
+    np.exp(channel, out=channel)
+    channel += np.float32(1)
+    np.reciprocal(channel, out=channel)
+    channel *= np.float32(255)
+    rgba[:, 3] = channel
+
+    # 4. Rotation (XYZW) - 4 bytes
+    q = np.empty((num_points, 4), dtype=np.float32)
+    for i, name in enumerate(('rot_0', 'rot_1', 'rot_2', 'rot_3')):
+        q[:, i] = data[name]
+
+    # Normalize quaternions; the floor keeps zero-length ones at zero without a mask
+    mag = np.linalg.norm(q, axis=1, keepdims=True)
+    np.maximum(mag, np.float32(1e-12), out=mag)
+    q /= mag
+    q *= np.float32(128)
+    q += np.float32(128)
+    np.clip(q, 0, 255, out=q)
+    rot[:] = q
+
+    # Write to file
+    with open(output_path, 'wb') as f:
+        f.write(splat_data.tobytes())
+
+
+def standardize_ply(input_path, output_path):
+    """Convert ML-Sharp PLY to industry-standard format."""
+
+    # Read original PLY vertex data
+    data = read_vertex_data(input_path)
+    if data is None:
+        raise ValueError("PLY file has no vertex element")
+
+    num_points = len(data)
+
+    if num_points == 0:
+        raise ValueError("PLY file has no vertices")
+
+    # Check required properties exist
+    required = ['x', 'y', 'z', 'f_dc_0', 'f_dc_1', 'f_dc_2', 'opacity',
+                'scale_0', 'scale_1', 'scale_2', 'rot_0', 'rot_1', 'rot_2', 'rot_3']
+
+    available_props = list(data.dtype.names)
+    missing = [p for p in required if p not in available_props]
+    if missing:
+        raise ValueError(f"Missing required properties: {missing}")
+
+    # When every vertex is a packed row of float32s, work on an (N, F) view
+    names = data.dtype.names
+    packed_f4 = (
+        data.flags.c_contiguous
+        and data.dtype.itemsize == 4 * len(names)
+        and all(data.dtype.fields[name][0] == np.dtype('<f4') for name in names)
+    )
+    flat = data.view('<f4').reshape(num_points, len(names)) if packed_f4 else None
+
+    # Filter out NaN/Infinity values
+    if flat is not None:
+        # One isfinite sweep over the whole block instead of one per property
+        checked = flat if len(names) == len(required) else flat[:, [names.index(p) for p in required]]
+        valid_mask = np.isfinite(checked).all(axis=1)
+    else:
+        valid_mask = np.ones(num_points, dtype=bool)
+        for prop in required:
+            valid_mask &= np.isfinite(data[prop])
+
+    num_valid = int(np.count_nonzero(valid_mask))
+    num_removed = num_points - num_valid
+
+    if num_valid == 0:
+        raise ValueError("All vertices contain NaN/Infinity values")
+
+    # Define industry-standard property order
+    dtype_standard = [
+        ('x', '<f4'), ('y', '<f4'), ('z', '<f4'),
+        ('scale_0', '<f4'), ('scale_1', '<f4'), ('scale_2', '<f4'),
+        ('rot_0', '<f4'), ('rot_1', '<f4'), ('rot_2', '<f4'), ('rot_3', '<f4'),
+        ('f_dc_0', '<f4'), ('f_dc_1', '<f4'), ('f_dc_2', '<f4'),
+        ('opacity', '<f4'),
+    ]
+
+    # Source property for each standard column. Quaternion goes from WXYZ
+    # (ML-Sharp: rot_0=w, rot_1=x, rot_2=y, rot_3=z) to XYZW (industry
+    # standard: rot_0=x, rot_1=y, rot_2=z, rot_3=w)
+    source_props = ['x', 'y', 'z', 'scale_0', 'scale_1', 'scale_2',
+                    'rot_1', 'rot_2', 'rot_3', 'rot_0',
+                    'f_dc_0', 'f_dc_1', 'f_dc_2', 'opacity']
+
+    if flat is not None:
+        # Filter and reorder the columns in a single gather, then view the
+        # result as the standard record
+        columns = [names.index(prop) for prop in source_props]
+        rows = np.flatnonzero(valid_mask)
+        new_data = flat[rows[:, None], columns].view(dtype_standard).reshape(num_valid)
+    else:
+        filtered_data = data[valid_mask]
+        new_data = np.empty(num_valid, dtype=dtype_standard)
+        for (prop, _), source in zip(dtype_standard, source_props):
+            new_data[prop] = filtered_data[source]
+
+    # Save clean .splat version
+    save_as_splat(new_data, output_path.replace('.ply.tmp', '.splat'))
+
+    # Create clean PLY with only vertex element
+    write_vertex_ply(new_data, output_path)
+
+    return num_valid, num_removed
+
+
+def standardize_in_place(ply_path, verbose=False):
+    """Standardize ply_path through a .ply.tmp file, then replace the original."""
+    ply_path = str(ply_path)
+    temp_output = os.path.splitext(ply_path)[0] + '.ply.tmp'
+    try:
+        num_valid, num_removed = standardize_ply(ply_path, temp_output)
+        os.replace(temp_output, ply_path)
+    except BaseException:
+        if os.path.exists(temp_output):
+            os.remove(temp_output)
+        raise
+    if verbose:
+        print(f"Standardized PLY: {num_valid} vertices")
+        if num_removed > 0:
+            print(f"Removed {num_removed} invalid vertices (NaN/Infinity)")
+    return num_valid, num_removed
+
+
+if __name__ == "__main__":
+    input_path = sys.argv[1]
+    output_path = sys.argv[2]
+    verbose = len(sys.argv) > 3 and sys.argv[3] == "-v"
+
+    try:
+        num_valid, num_removed = standardize_ply(input_path, output_path)
+        if verbose:
+            print(f"Standardized PLY: {num_valid} vertices")
+            if num_removed > 0:
+                print(f"Removed {num_removed} invalid vertices (NaN/Infinity)")
+        sys.exit(0)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
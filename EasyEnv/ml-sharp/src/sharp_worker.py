@@ -0,0 +1,242 @@
+"""
+Persistent ML-Sharp prediction worker, run inside ml-sharp's embedded Python.
+Started once by sharp_wrapper.py and kept alive, so torch, gsplat and the
+loaded model stay resident and later predictions skip interpreter start-up,
+imports and checkpoint loading.
+
+Protocol: one JSON request per line on stdin, one JSON reply per line on stdout.
+
+    request: {"image": str, "output": str, "checkpoint": str or null,
+              "device": str, "verbose": bool, "bf16": bool (optional)}
+    reply:   {"ok": true, "ply": str} or {"ok": false, "error": str}
+
+A request may carry "views": [{"image": str, "output": str}, ...] instead of
+"image"/"output"; those are predicted together and the reply has "plys": [str].
+Adding "pipelined": true processes them one by one with loading and saving
+overlapped (see predict_views).
+
+A request may also carry an "id", which is echoed in its reply so the caller
+can detect a reply channel that got out of sync.
+
+Everything else the worker, its libraries, native extensions and child
+processes print goes to stderr, so stdout carries replies only. The worker
+exits when stdin is closed.
+"""
+
+import json
+import logging
+import os
+import sys
+import traceback
+
+# Keep the reply channel clean at the OS level: replies go to a private copy of fd 1,
+# and fd 1 itself (used by C/C++ code and inherited by child processes) becomes stderr
+sys.stdout.flush()
+_replies = os.fdopen(os.dup(1), "w", encoding="utf-8")
+os.dup2(2, 1)
+sys.stdout = sys.stderr
+
+# The embeddable Python ignores PYTHONPATH and the script directory (._pth file)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from pathlib import Path
+
+import torch
+
+from sharp.cli.predict import DEFAULT_MODEL_URL, predict_image
+from sharp.models import PredictorParams, create_predictor
+from sharp.utils import io
+from sharp.utils import logging as logging_utils
+from sharp.utils.gaussians import Gaussians3D, save_ply
+from sharp_postprocess import standardize_in_place
+
+LOGGER = logging.getLogger("sharp_worker")
+
+# (checkpoint, device) -> loaded predictor; only the most recent one is kept resident
+_predictors = {}
+
+# Set by sharp_wrapper.py (ENABLE_TORCH_COMPILE); kernels are cached in TORCHINDUCTOR_CACHE_DIR
+_torch_compile = os.environ.get("SHARP_TORCH_COMPILE") == "1"
+
+
+def resolve_device(device):
+    """Map 'default' to the best available device, as `sharp predict` does."""
+    if device != "default":
+        return device
+    if torch.cuda.is_available():
+        return "cuda"
+    if torch.mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+def get_predictor(checkpoint, device):
+    """Return the model for checkpoint/device, loading it on first use."""
+    key = (checkpoint, device)
+    predictor = _predictors.get(key)
+    if predictor is None:
+        _predictors.clear()  # Release the previous model's memory before loading another
+
+        if checkpoint is None:
+            LOGGER.info("No checkpoint provided. Downloading default model from %s", DEFAULT_MODEL_URL)
+            state_dict = torch.hub.load_state_dict_from_url(DEFAULT_MODEL_URL, progress=True)
+        else:
+            LOGGER.info("Loading checkpoint from %s", checkpoint)
+            # Memory-mapped: tensors are read straight from the page cache while being copied
+            # into the model, instead of into a full intermediate heap copy of the file
+            state_dict = torch.load(checkpoint, map_location="cpu", mmap=True, weights_only=True)
+
+        predictor = create_predictor(PredictorParams())
+        predictor.load_state_dict(state_dict)
+        del state_dict  # Drop the mapping; the model holds its own copy of the weights
+        predictor.eval()
+        predictor.to(device)
+        if _torch_compile and device == "cuda":
+            # Default mode: CUDA graphs (reduce-overhead) do not mix with predict_views' streams
+            LOGGER.info("Compiling predictor with torch.compile")
+            predictor = torch.compile(predictor, dynamic=False)
+        _predictors[key] = predictor
+    return predictor
+
+
+def bf16_supported(device):
+    """Whether bfloat16 autocast is used for this device (CUDA GPUs with bf16 support)."""
+    return device == "cuda" and torch.cuda.is_bf16_supported()
+
+
+def _predict_image(predictor, rgb, f_px, torch_device, bf16):
+    """predict_image, under bfloat16 autocast when bf16 is set (see bf16_supported)."""
+    if not bf16:
+        return predict_image(predictor, rgb, f_px, torch_device)
+    with torch.autocast("cuda", dtype=torch.bfloat16):
+        gaussians = predict_image(predictor, rgb, f_px, torch_device)
+    # save_ply goes through numpy, which has no bfloat16
+    return Gaussians3D(*(tensor.float() for tensor in gaussians))
+
+
+def _run_views(predictor, inputs, device, bf16=False):
+    """Forward passes for (rgb, f_px, ply_path) inputs; see predict_views."""
+    torch_device = torch.device(device)
+    if device == "cuda" and len(inputs) > 1:
+        streams = [torch.cuda.Stream() for _ in range(min(len(inputs), 4))]
+        results = []
+        for i, (rgb, f_px, _) in enumerate(inputs):
+            with torch.cuda.stream(streams[i % len(streams)]):
+                results.append(_predict_image(predictor, rgb, f_px, torch_device, bf16))
+        torch.cuda.synchronize()  # Saving reads the results on the default stream
+        return results
+    return [_predict_image(predictor, rgb, f_px, torch_device, bf16) for rgb, f_px, _ in inputs]
+
+
+def _load_view(view):
+    """Read one {"image", "output"} view; returns (rgb, f_px, ply_path)."""
+    image_path = Path(view["image"])
+    output_path = Path(view["output"])
+    output_path.mkdir(exist_ok=True, parents=True)
+    LOGGER.info("Processing %s", image_path)
+    rgb, _, f_px = io.load_rgb(image_path)
+    return rgb, f_px, output_path / f"{image_path.stem}.ply"
+
+
+def _save_view(gaussians, rgb, f_px, ply_path, verbose):
+    """Write and standardize one view's PLY (and .splat); returns its path as str."""
+    height, width = rgb.shape[:2]
+    LOGGER.info("Saving 3DGS to %s", ply_path)
+    save_ply(gaussians, f_px, (height, width), ply_path)
+    standardize_in_place(ply_path, verbose=verbose)
+    return str(ply_path)
+
+
+def _predict_pipelined(predictor, views, device, verbose, bf16=False):
+    """
+    One view at a time, with the next image loading and the previous result saving on
+    helper threads while the current forward pass runs. At most two results wait to be saved.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    torch_device = torch.device(device)
+    saves = []
+    with ThreadPoolExecutor(max_workers=1) as loader, ThreadPoolExecutor(max_workers=1) as saver:
+        pending = loader.submit(_load_view, views[0])
+        for i in range(len(views)):
+            rgb, f_px, ply_path = pending.result()
+            if i + 1 < len(views):
+                pending = loader.submit(_load_view, views[i + 1])
+            gaussians = _predict_image(predictor, rgb, f_px, torch_device, bf16)
+            if len(saves) >= 2:
+                saves[-2].result()
+            saves.append(saver.submit(_save_view, gaussians, rgb, f_px, ply_path, verbose))
+        return [save.result() for save in saves]
+
+
+def predict_views(views, checkpoint=None, device="default", verbose=False, pipelined=False, bf16=False):
+    """
+    Predict Gaussians for several {"image", "output"} views with one model and write the
+    standardized PLYs (and .splats). On CUDA the forward passes are queued round-robin on
+    up to four streams, so one view's uploads and kernels overlap another's.
+    pipelined=True instead streams the views through _predict_pipelined, which keeps memory
+    flat for long batches and overlaps image loading and saving with inference.
+    bf16=True runs the model under bfloat16 autocast where supported (less memory traffic,
+    slightly different splats); elsewhere it is ignored.
+    """
+    logging_utils.configure(logging.DEBUG if verbose else logging.INFO)
+
+    device = resolve_device(device)
+    LOGGER.info("Using device %s", device)
+    predictor = get_predictor(checkpoint, device)
+    bf16 = bf16 and bf16_supported(device)
+    if bf16:
+        LOGGER.info("Using bfloat16 autocast")
+
+    inputs = None if pipelined else [_load_view(view) for view in views]
+
+    def run(model):
+        if inputs is None:
+            return _predict_pipelined(model, views, device, verbose, bf16) if views else []
+        results = _run_views(model, inputs, device, bf16)
+        return [
+            _save_view(gaussians, rgb, f_px, ply_path, verbose)
+            for (rgb, f_px, ply_path), gaussians in zip(inputs, results)
+        ]
+
+    try:
+        return run(predictor)
+    except Exception:
+        original = getattr(predictor, "_orig_mod", None)
+        if original is None:
+            raise
+        # Compilation happens on the first call and needs a working Triton; keep the eager model
+        LOGGER.warning("torch.compile failed, falling back to eager mode", exc_info=True)
+        for key, cached in _predictors.items():
+            if cached is predictor:
+                _predictors[key] = original
+        return run(original)
+
+
+def predict(image, output, checkpoint=None, device="default", verbose=False, bf16=False):
+    """Predict Gaussians for one image and write the standardized PLY (and .splat)."""
+    return predict_views([{"image": image, "output": output}], checkpoint, device, verbose, bf16=bf16)[0]
+
+
+def main():
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        job_id = None
+        try:
+            job = json.loads(line)
+            job_id = job.pop("id", None)
+            if "views" in job:
+                reply = {"ok": True, "plys": predict_views(**job)}
+            else:
+                reply = {"ok": True, "ply": predict(**job)}
+        except Exception as e:
+            traceback.print_exc()
+            reply = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        reply["id"] = job_id
+        _replies.write(json.dumps(reply) + "\n")
+        _replies.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+CPU affinity for the add-on's helper processes (ml-sharp worker, pip installs).
+Limiting them to all but one core means their large thread pools (torch, pip's
+unpacking) cannot occupy every core Blender itself wants to run on. The cost is
+that the helper gets one core less of compute, so small machines are not limited.
+"""
+
+import os
+import sys
+
+# Below this many usable CPUs giving up a core costs more than the contention it avoids
+MIN_CPUS_TO_RESERVE = 4
+
+PROCESS_SET_INFORMATION = 0x0200
+
+
+def background_cores() -> set:
+    """CPUs for helper processes: one fewer than Blender may use, or all of them on small machines."""
+    if hasattr(os, 'sched_getaffinity'):
+        cores = sorted(os.sched_getaffinity(0))
+    else:
+        cores = list(range(os.cpu_count() or 1))
+    if len(cores) < MIN_CPUS_TO_RESERVE:
+        return set(cores)
+    return set(cores[1:])
+
+
+def set_process_affinity(proc, cores) -> bool:
+    """
+    Pin a started subprocess.Popen to the given CPU indices.
+    Call it right after spawning: on Linux only threads created afterwards inherit the mask.
+
+    Returns:
+        bool: True if the affinity was applied
+    """
+    try:
+        if hasattr(os, 'sched_setaffinity'):  # Linux
+            os.sched_setaffinity(proc.pid, cores)
+            return True
+        if sys.platform == 'win32':
+            import ctypes
+            from ctypes import wintypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+            kernel32.OpenProcess.restype = wintypes.HANDLE
+            kernel32.SetProcessAffinityMask.argtypes = [wintypes.HANDLE, ctypes.c_size_t]
+            kernel32.SetProcessAffinityMask.restype = wintypes.BOOL
+            kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+            # One mask covers the first 64 CPUs (a single processor group)
+            mask = sum(1 << core for core in cores if core < 64)
+            if mask == 0:
+                return False
+            handle = kernel32.OpenProcess(PROCESS_SET_INFORMATION, False, proc.pid)
+            if not handle:
+                return False
+            try:
+                return bool(kernel32.SetProcessAffinityMask(handle, mask))
+            finally:
+                kernel32.CloseHandle(handle)
+    except (OSError, AttributeError, ValueError) as e:
+        print(f"Could not set CPU affinity: {e}")
+    return False
@@ -7,11 +7,30 @@ This avoids modifying Blender's Python installation.
 import os
 import sys
 import subprocess
+import threading
 from pathlib import Path
 
+from .process_affinity import background_cores, set_process_affinity
+
 ADDON_DIR = Path(__file__).parent
 MLSHARP_DIR = ADDON_DIR / "ml-sharp"
 MLSHARP_ENV_DIR = MLSHARP_DIR / "Env"
+MLSHARP_SRC_DIR = MLSHARP_DIR / "src"
+
+# PLY standardization module, run inside ml-sharp's embedded Python
+POSTPROCESS_SCRIPT = MLSHARP_SRC_DIR / "sharp_postprocess.py"
+# Long-lived prediction process (see _MLSharpWorker)
+WORKER_SCRIPT = MLSHARP_SRC_DIR / "sharp_worker.py"
+LAUNCHER_SCRIPT = MLSHARP_SRC_DIR / "sharp_launcher.py"
+
+# Vertex properties of an industry-standard 3DGS PLY, in file order
+STANDARD_PLY_PROPERTIES = (
+    'x', 'y', 'z',
+    'scale_0', 'scale_1', 'scale_2',
+    'rot_0', 'rot_1', 'rot_2', 'rot_3',
+    'f_dc_0', 'f_dc_1', 'f_dc_2',
+    'opacity',
+)
 
 # Detect ml-sharp's embedded Python executable
 if os.name == 'nt':  # Windows
@@ -19,13 +38,223 @@ if os.name == 'nt':  # Windows
 else:  # macOS/Linux
     MLSHARP_PYTHON = MLSHARP_ENV_DIR / "bin" / "python"
 
+# String forms for subprocess argv/cwd/env, built once instead of on every launch
+_MLSHARP_PYTHON_STR = str(MLSHARP_PYTHON)
+_MLSHARP_DIR_STR = str(MLSHARP_DIR)
+_MLSHARP_SRC_STR = str(MLSHARP_SRC_DIR)
+_WORKER_SCRIPT_STR = str(WORKER_SCRIPT)
+_LAUNCHER_SCRIPT_STR = str(LAUNCHER_SCRIPT)
+_POSTPROCESS_SCRIPT_STR = str(POSTPROCESS_SCRIPT)
+
+
+# Let the persistent worker torch.compile the model on CUDA. Off by default: it needs
+# Triton and the first prediction pays the compile time (later sessions reuse the cache)
+ENABLE_TORCH_COMPILE = False
+INDUCTOR_CACHE_DIR = MLSHARP_DIR / ".inductor_cache"
+
+_base_env = None  # Built on first use; reset by invalidate_env_cache()
+
+
+def _mlsharp_env() -> dict:
+    """
+    Environment for ml-sharp subprocesses. src is not added to PYTHONPATH: the embeddable
+    Python ignores it, so every script run there puts src on sys.path itself.
+    Built once and shared by every launch; treat the returned dict as read-only.
+    """
+    global _base_env
+    if _base_env is None:
+        env = os.environ.copy()
+        if ENABLE_TORCH_COMPILE:
+            env['SHARP_TORCH_COMPILE'] = '1'
+            env.setdefault('TORCHINDUCTOR_CACHE_DIR', str(INDUCTOR_CACHE_DIR))
+        _base_env = env
+    return _base_env
+
+
+class _MLSharpWorker:
+    """
+    Persistent ml-sharp process serving predictions as JSON lines over stdin/stdout.
+    torch, gsplat and the model are loaded once and reused by every later request.
+    The worker's own logging goes to stderr, which is shared with Blender's console.
+    """
+
+    def __init__(self, env_overrides: dict = None, cores: set = None):
+        self.proc = None
+        self.lock = threading.Lock()
+        self.env_overrides = env_overrides  # e.g. {'CUDA_VISIBLE_DEVICES': '1'} for a pool member
+        self.cores = cores  # CPU affinity for the next start; None means background_cores()
+        self.next_id = 0  # Echoed by the worker so a stray or stale reply is detected
+
+    def is_running(self) -> bool:
+        return self.proc is not None and self.proc.poll() is None
+
+    def _start(self):
+        print(f"Starting ML-Sharp worker with embedded Python: {MLSHARP_PYTHON.name}")
+        self.proc = subprocess.Popen(
+            [_MLSHARP_PYTHON_STR, "-u", _WORKER_SCRIPT_STR],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            cwd=_MLSHARP_DIR_STR,
+            env=dict(_mlsharp_env(), **self.env_overrides) if self.env_overrides else _mlsharp_env()
+        )
+        # Leave Blender a core that torch's thread pool does not compete for
+        set_process_affinity(self.proc, self.cores or background_cores())
+
+    def ensure_started(self):
+        """Start the process if it is not running; returns without waiting for its imports."""
+        with self.lock:
+            if not self.is_running():
+                self._start()
+
+    def request(self, job: dict) -> dict:
+        """Send one job and wait for its reply, (re)starting the process if needed."""
+        import json
+
+        with self.lock:
+            if not self.is_running():
+                self._start()
+            self.next_id += 1
+            job = dict(job, id=self.next_id)
+            try:
+                self.proc.stdin.write(json.dumps(job) + "\n")
+                self.proc.stdin.flush()
+                line = self.proc.stdout.readline()
+            except OSError:
+                line = ''
+            if not line:
+                # Crashed (e.g. out of memory); the next request starts a fresh worker
+                returncode = self.proc.wait()
+                self.proc = None
+                raise RuntimeError(f"ML-Sharp worker exited unexpectedly with code {returncode}")
+            try:
+                reply = json.loads(line)
+            except ValueError:
+                reply = None
+            if not isinstance(reply, dict) or reply.get('id') != job['id']:
+                # Later replies could belong to other jobs; replace the process instead
+                self._kill()
+                raise RuntimeError(f"ML-Sharp worker reply out of sync, restarting worker: {line.strip()[:200]}")
+            return reply
+
+    def _kill(self):
+        self.proc.kill()
+        self.proc.wait()
+        self.proc = None
+
+    def stop(self, timeout: float = 5.0):
+        """Close the worker's stdin so it exits, killing it if it does not."""
+        with self.lock:
+            if self.proc is None:
+                return
+            try:
+                self.proc.stdin.close()
+                self.proc.wait(timeout=timeout)
+            except (OSError, subprocess.TimeoutExpired):
+                self._kill()
+            self.proc = None
+
+
+_worker = None
+_worker_lock = threading.Lock()  # register()'s warm-up thread and operators may race to create it
+
+
+def _get_worker() -> _MLSharpWorker:
+    global _worker
+    if _worker is None:
+        with _worker_lock:
+            if _worker is None:
+                _worker = _MLSharpWorker()
+    return _worker
+
+
+def warmup_mlsharp() -> bool:
+    """
+    Start the persistent worker ahead of the first prediction, so its torch/gsplat/sharp
+    imports run in the background instead of on the first Generate click.
+
+    Returns:
+        bool: True if the worker was started (or already running)
+    """
+    if not MLSHARP_PYTHON.exists() or not WORKER_SCRIPT.exists():
+        return False
+    _get_worker().ensure_started()
+    return True
+
+
+def shutdown_worker():
+    """Stop the persistent ml-sharp worker, if one was started (call on add-on unregister)."""
+    if _worker is not None:
+        _worker.stop()
+
+
+def _require_mlsharp_python():
+    """Raise FileNotFoundError if ml-sharp's embedded Python is missing."""
+    if not MLSHARP_PYTHON.exists():
+        raise FileNotFoundError(
+            f"ML-Sharp embedded Python not found at: {MLSHARP_PYTHON}\n"
+            f"Expected location: {MLSHARP_ENV_DIR}\n"
+            "Please ensure ml-sharp's Env folder is present."
+        )
+
+
+_ensured_dirs = set()  # Output directories already created by this session
+
+
+def _ensure_output_dir(output_path: Path):
+    """Create output_path (and parents) the first time it is used; later calls skip the syscalls."""
+    key = str(output_path)
+    if key not in _ensured_dirs:
+        output_path.mkdir(exist_ok=True, parents=True)
+        _ensured_dirs.add(key)
+
+
+BUNDLED_CHECKPOINT = MLSHARP_DIR / "sharp_2572gikvuh.pt"
+_bundled_checkpoint = False  # Resolved on first use (path or None); reset by invalidate_env_cache()
+
+
+def _default_checkpoint():
+    """Bundled checkpoint path, or None to let ml-sharp download the default model."""
+    global _bundled_checkpoint
+    if _bundled_checkpoint is False:
+        _bundled_checkpoint = BUNDLED_CHECKPOINT if BUNDLED_CHECKPOINT.is_file() else None
+    return _bundled_checkpoint
+
+
+# One-shot prediction argv; None slots (listed in _PREDICT_CMD_SLOTS) are filled per call.
+# The launcher adds src to sys.path itself (Windows embeddable Python ignores PYTHONPATH),
+# runs sharp.cli and then standardizes the result in the same process (saves a second
+# interpreter start-up and numpy import)
+_PREDICT_CMD_TEMPLATE = [
+    _MLSHARP_PYTHON_STR,
+    _LAUNCHER_SCRIPT_STR,
+    "--standardize", None,  # output PLY
+    "predict",
+    "-i", None,  # image
+    "-o", None,  # output directory
+    "--device", None,
+]
+_PREDICT_CMD_SLOTS = tuple(i for i, arg in enumerate(_PREDICT_CMD_TEMPLATE) if arg is None)
+
+
+def _format_command(cmd: list) -> str:
+    """Command line for logs and error messages, quoted for the current platform's shell."""
+    if os.name == 'nt':
+        return subprocess.list2cmdline(cmd)
+    import shlex
+    return shlex.join(cmd)
+
 
 def predict_gaussians_from_image(
     image_path: Path,
     output_path: Path,
     checkpoint_path: Path = None,
     device: str = "default",
-    verbose: bool = False
+    verbose: bool = False,
+    persistent: bool = True,
+    bf16: bool = False,
+    cpu_affinity: set = None
 ) -> Path:
     """
     Generate Gaussian Splatting PLY file from a single image.
@@ -37,6 +266,12 @@ def predict_gaussians_from_image(
         checkpoint_path: Path to model checkpoint (optional, will download if not provided)
         device: Device to use ('cpu', 'cuda', 'mps', or 'default')
         verbose: Enable verbose logging
+        persistent: Run in the long-lived ml-sharp worker, which keeps the model loaded
+            between calls; False starts a one-shot process that exits afterwards
+        bf16: Run the model under bfloat16 autocast on CUDA GPUs that support it (less memory
+            traffic; results can differ slightly). Persistent worker only, ignored elsewhere
+        cpu_affinity: CPU indices to pin the ml-sharp process to (default: background_cores()).
+            For the persistent worker this takes effect when this call starts the process
     
     Returns:
         Path to generated PLY file
@@ -47,48 +282,30 @@ def predict_gaussians_from_image(
     """
     
     # Validate ml-sharp Python exists
-    if not MLSHARP_PYTHON.exists():
-        raise FileNotFoundError(
-            f"ML-Sharp embedded Python not found at: {MLSHARP_PYTHON}\n"
-            f"Expected location: {MLSHARP_ENV_DIR}\n"
-            "Please ensure ml-sharp's Env folder is present."
-        )
+    _require_mlsharp_python()
     
     # Validate input
     if not image_path.exists():
         raise FileNotFoundError(f"Input image not found: {image_path}")
     
     # Create output directory
-    output_path.mkdir(exist_ok=True, parents=True)
+    _ensure_output_dir(output_path)
     
     # Check for checkpoint
     if checkpoint_path is None:
-        bundled_checkpoint = MLSHARP_DIR / "sharp_2572gikvuh.pt"
-        if bundled_checkpoint.exists():
-            checkpoint_path = bundled_checkpoint
+        checkpoint_path = _default_checkpoint()
     
-    # Build command
-    # Note: Windows embeddable Python often ignores PYTHONPATH, so we need to
-    # modify sys.path at runtime using a wrapper script approach
-    mlsharp_src = str(MLSHARP_DIR / "src")
+    if persistent:
+        return _predict_with_worker(image_path, output_path, checkpoint_path, device, verbose, cpu_affinity, bf16)
 
-    # Create inline Python code that adds src to path and runs sharp.cli
-    python_code = f"""
-import sys
-sys.path.insert(0, {repr(mlsharp_src)})
-from sharp.cli import main_cli
-sys.exit(main_cli())
-"""
+    # sharp predict writes <image stem>.ply into the output directory
+    output_ply = output_path / f"{image_path.stem}.ply"
 
-    # Build command with arguments for sharp CLI
-    cmd = [
-        str(MLSHARP_PYTHON),
-        "-c", python_code,
-        "predict",
-        "-i", str(image_path),
-        "-o", str(output_path),
-        "--device", device
-    ]
+    cmd = _PREDICT_CMD_TEMPLATE.copy()
+    cmd[_PREDICT_CMD_SLOTS[0]] = str(output_ply)
+    cmd[_PREDICT_CMD_SLOTS[1]] = str(image_path)
+    cmd[_PREDICT_CMD_SLOTS[2]] = str(output_path)
+    cmd[_PREDICT_CMD_SLOTS[3]] = device
 
     if checkpoint_path:
         cmd.extend(["-c", str(checkpoint_path)])
@@ -96,87 +313,402 @@ sys.exit(main_cli())
     if verbose:
         cmd.append("-v")
 
-    # Still set PYTHONPATH as backup (works on some systems)
-    env = os.environ.copy()
-    if 'PYTHONPATH' in env:
-        env['PYTHONPATH'] = mlsharp_src + os.pathsep + env['PYTHONPATH']
-    else:
-        env['PYTHONPATH'] = mlsharp_src
+    env = _mlsharp_env()
     
     # Run ml-sharp prediction
     print(f"Running ML-Sharp with embedded Python: {MLSHARP_PYTHON.name}")
     print(f"Processing: {image_path.name}")
     print(f"Output directory: {output_path}")
     if verbose:
-        print(f"Command: {' '.join(cmd)}")
-        print(f"PYTHONPATH: {env['PYTHONPATH']}")
+        print(f"Command: {_format_command(cmd)}")
     
+    # Stream the combined output instead of buffering all of it: verbose runs show it
+    # live, and only the last lines are kept for the error message. Quiet runs read raw
+    # bytes and only decode that tail if the prediction fails
+    from collections import deque
+    tail = deque(maxlen=200)
+    text_mode = {'text': True, 'encoding': 'utf-8', 'errors': 'replace', 'bufsize': 1} if verbose else {}
     try:
-        result = subprocess.run(
+        process = subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True,
-            check=True,
-            cwd=str(MLSHARP_DIR),
-            env=env  # Pass the modified environment
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            cwd=_MLSHARP_DIR_STR,
+            env=env,  # Pass the modified environment
+            **text_mode
         )
-        
-        if verbose:
-            print("=== ML-Sharp Output ===")
-            print(result.stdout)
-        
-        # Find generated PLY file
-        output_ply = output_path / f"{image_path.stem}.ply"
+        set_process_affinity(process, cpu_affinity or background_cores())
+        with process:
+            if verbose:
+                print("=== ML-Sharp Output ===")
+            for line in process.stdout:
+                if verbose:
+                    print(line, end='')
+                tail.append(line)
+    except Exception as e:
+        raise RuntimeError(f"Unexpected error during prediction: {e}")
 
-        if output_ply.exists():
-            print(f"Successfully generated: {output_ply.name}")
+    if process.returncode != 0:
+        error_msg = f"ML-Sharp prediction failed with exit code {process.returncode}\n"
+        error_msg += f"Command: {_format_command(cmd)}\n"
+        if tail:
+            output = ''.join(tail) if verbose else b''.join(tail).decode('utf-8', errors='replace')
+            error_msg += f"Output (last {len(tail)} lines):\n{output}"
+        raise RuntimeError(error_msg)
 
-            # Convert to industry-standard PLY format for compatibility
-            # with Houdini, SuperSplat, and other 3DGS software
-            print("Converting to industry-standard PLY format...")
-            standardize_ply_format(output_ply, verbose=verbose)
-            print(f"PLY format standardized: {output_ply.name}")
+    # Find generated PLY file, already converted to industry-standard
+    # format for compatibility with Houdini, SuperSplat, and other 3DGS software
+    if not output_ply.exists():
+        raise RuntimeError(f"Expected output PLY not found: {output_ply}")
+
+    print(f"Successfully generated: {output_ply.name}")
+    print(f"PLY format standardized: {output_ply.name}")
+    return output_ply
+
+
+def _worker_job(image_path: Path, output_path: Path, checkpoint_path, device: str, verbose: bool,
+                bf16: bool = False) -> dict:
+    """Build one sharp_worker.py request."""
+    return {
+        'image': str(image_path),
+        'output': str(output_path),
+        'checkpoint': str(checkpoint_path) if checkpoint_path else None,
+        'device': device,
+        'verbose': verbose,
+        'bf16': bf16,
+    }
 
-            return output_ply
-        else:
-            raise RuntimeError(f"Expected output PLY not found: {output_ply}")
-            
-    except subprocess.CalledProcessError as e:
-        error_msg = f"ML-Sharp prediction failed with exit code {e.returncode}\n"
-        error_msg += f"Command: {' '.join(cmd)}\n"
-        if e.stdout:
-            error_msg += f"Output: {e.stdout}\n"
-        if e.stderr:
-            error_msg += f"Error: {e.stderr}"
-        raise RuntimeError(error_msg)
-    except Exception as e:
-        raise RuntimeError(f"Unexpected error during prediction: {e}")
+
+def _reply_ply(reply: dict, image_path: Path) -> Path:
+    """Return the PLY path from a worker reply, raising RuntimeError on failure."""
+    if not reply.get('ok'):
+        raise RuntimeError(f"ML-Sharp prediction failed for {image_path.name}: {reply.get('error')}")
+    return _worker_ply(reply['ply'])
+
+
+def _worker_ply(ply: str) -> Path:
+    """Check that a PLY reported by the worker exists and return its path."""
+    output_ply = Path(ply)
+    if not output_ply.exists():
+        raise RuntimeError(f"Expected output PLY not found: {output_ply}")
+
+    print(f"Successfully generated: {output_ply.name}")
+    print(f"PLY format standardized: {output_ply.name}")
+    return output_ply
+
+
+def _predict_with_worker(image_path: Path, output_path: Path, checkpoint_path, device: str, verbose: bool,
+                         cpu_affinity: set = None, bf16: bool = False) -> Path:
+    """Run one prediction in the persistent worker (see predict_gaussians_from_image)."""
+    print(f"Processing: {image_path.name}")
+    print(f"Output directory: {output_path}")
+
+    worker = _get_worker()
+    if cpu_affinity is not None and not worker.is_running():
+        worker.cores = cpu_affinity
+    reply = worker.request(_worker_job(image_path, output_path, checkpoint_path, device, verbose, bf16))
+    return _reply_ply(reply, image_path)
+
+
+def _run_worker_once(jobs: list, cpu_affinity: set = None) -> list:
+    """
+    Feed all jobs to a fresh sharp_worker.py process and let it exit at end of input.
+    One interpreter start and one model load for the whole batch.
+
+    Returns:
+        list: One reply dict per job
+    """
+    import json
+
+    print(f"Running ML-Sharp batch with embedded Python: {MLSHARP_PYTHON.name}")
+    process = subprocess.Popen(
+        [_MLSHARP_PYTHON_STR, "-u", _WORKER_SCRIPT_STR],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+        encoding='utf-8',
+        cwd=_MLSHARP_DIR_STR,
+        env=_mlsharp_env()
+    )
+    # Same background-core policy as the persistent worker
+    set_process_affinity(process, cpu_affinity or background_cores())
+    stdout, _ = process.communicate("".join(json.dumps(job) + "\n" for job in jobs))
+
+    replies = [json.loads(line) for line in stdout.splitlines() if line.strip()]
+    if len(replies) < len(jobs):
+        raise RuntimeError(
+            f"ML-Sharp batch stopped after {len(replies)} of {len(jobs)} images "
+            f"(exit code {process.returncode})"
+        )
+    return replies
+
+
+def predict_gaussians_from_images(
+    image_paths: list,
+    output_path: Path,
+    checkpoint_path: Path = None,
+    device: str = "default",
+    verbose: bool = False,
+    persistent: bool = True,
+    cpu_affinity: set = None
+) -> list:
+    """
+    Generate Gaussian Splatting PLY files for several images with a single model load.
+
+    Args:
+        image_paths: Paths to input images
+        output_path: Directory to save output PLY files
+        checkpoint_path: Path to model checkpoint (optional, will download if not provided)
+        device: Device to use ('cpu', 'cuda', 'mps', or 'default')
+        verbose: Enable verbose logging
+        persistent: Use the long-lived worker; False runs the batch in one process that exits afterwards
+        cpu_affinity: CPU indices to pin the ml-sharp process to (default: background_cores()).
+            For the persistent worker this takes effect when this call starts the process
+
+    Returns:
+        list: Paths to the generated PLY files, in input order
+
+    Raises:
+        FileNotFoundError: If an input image or ml-sharp Python is not found
+        RuntimeError: If any prediction fails
+    """
+    _require_mlsharp_python()
+
+    image_paths = [Path(p) for p in image_paths]
+    for image_path in image_paths:
+        if not image_path.exists():
+            raise FileNotFoundError(f"Input image not found: {image_path}")
+
+    _ensure_output_dir(output_path)
+
+    if checkpoint_path is None:
+        checkpoint_path = _default_checkpoint()
+
+    print(f"Processing {len(image_paths)} images")
+    print(f"Output directory: {output_path}")
+
+    jobs = [_worker_job(image_path, output_path, checkpoint_path, device, verbose) for image_path in image_paths]
+    if persistent:
+        worker = _get_worker()
+        if cpu_affinity is not None and not worker.is_running():
+            worker.cores = cpu_affinity
+        return [_reply_ply(worker.request(job), image_path) for job, image_path in zip(jobs, image_paths)]
+
+    replies = _run_worker_once(jobs, cpu_affinity)
+    return [_reply_ply(reply, image_path) for reply, image_path in zip(replies, image_paths)]
+
+
+def predict_gaussians_multiview(
+    views: list,
+    checkpoint_path: Path = None,
+    device: str = "default",
+    verbose: bool = False
+) -> list:
+    """
+    Generate Gaussian Splatting PLY files for several views in one persistent-worker request.
+    On CUDA the worker overlaps the views' forward passes on separate streams.
+
+    Args:
+        views: (image_path, output_path) pairs; each PLY is written to its own output directory
+        checkpoint_path: Path to model checkpoint (optional, will download if not provided)
+        device: Device to use ('cpu', 'cuda', 'mps', or 'default')
+        verbose: Enable verbose logging
+
+    Returns:
+        list: Paths to the generated PLY files, in input order
+
+    Raises:
+        FileNotFoundError: If an input image or ml-sharp Python is not found
+        RuntimeError: If the prediction fails
+    """
+    _require_mlsharp_python()
+
+    views = [(Path(image_path), Path(output_path)) for image_path, output_path in views]
+    for image_path, output_path in views:
+        if not image_path.exists():
+            raise FileNotFoundError(f"Input image not found: {image_path}")
+        _ensure_output_dir(output_path)
+
+    if checkpoint_path is None:
+        checkpoint_path = _default_checkpoint()
+
+    print(f"Processing {len(views)} views in one request")
+    return _request_views(_get_worker(), _views_job(views, checkpoint_path, device, verbose))
+
+
+def _views_job(views: list, checkpoint_path, device: str, verbose: bool, pipelined: bool = False) -> dict:
+    """Build one multi-view sharp_worker.py request from (image_path, output_path) pairs."""
+    return {
+        'views': [{'image': str(image_path), 'output': str(output_path)} for image_path, output_path in views],
+        'checkpoint': str(checkpoint_path) if checkpoint_path else None,
+        'device': device,
+        'verbose': verbose,
+        'pipelined': pipelined,
+    }
+
+
+def _request_views(worker: _MLSharpWorker, job: dict) -> list:
+    """Send a multi-view request and return the PLY paths, raising RuntimeError on failure."""
+    reply = worker.request(job)
+    if not reply.get('ok'):
+        raise RuntimeError(f"ML-Sharp multi-view prediction failed: {reply.get('error')}")
+    return [_worker_ply(ply) for ply in reply['plys']]
+
+
+def _cuda_device_count() -> int:
+    """Number of NVIDIA GPUs listed by nvidia-smi (0 if none or nvidia-smi is unavailable)."""
+    try:
+        result = subprocess.run(["nvidia-smi", "-L"], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        return 0
+    if result.returncode != 0:
+        return 0
+    return sum(1 for line in result.stdout.splitlines() if line.startswith("GPU "))
+
+
+def predict_gaussians_batch(
+    image_paths: list,
+    output_path: Path,
+    workers: int = 2,
+    checkpoint_path: Path = None,
+    device: str = "default",
+    verbose: bool = False
+) -> list:
+    """
+    Generate Gaussian Splatting PLY files for several images, overlapping each image's loading
+    and saving with the inference of its neighbours inside the persistent worker.
+
+    With several CUDA GPUs the images are split across up to `workers` processes, one per GPU:
+    the persistent worker takes GPU 0 and temporary workers, pinned with CUDA_VISIBLE_DEVICES,
+    take the others and are stopped when the batch is done. A single GPU, CPU or MPS always
+    uses the persistent worker alone, so no extra model copy competes for the device.
+
+    Args:
+        image_paths: Paths to input images
+        output_path: Directory to save output PLY files
+        workers: Maximum number of worker processes (only used with several CUDA GPUs)
+        checkpoint_path: Path to model checkpoint (optional, will download if not provided)
+        device: Device to use ('cpu', 'cuda', 'mps', or 'default')
+        verbose: Enable verbose logging
+
+    Returns:
+        list: Paths to the generated PLY files, in input order
+
+    Raises:
+        FileNotFoundError: If an input image or ml-sharp Python is not found
+        RuntimeError: If any prediction fails
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    _require_mlsharp_python()
+
+    image_paths = [Path(p) for p in image_paths]
+    for image_path in image_paths:
+        if not image_path.exists():
+            raise FileNotFoundError(f"Input image not found: {image_path}")
+
+    _ensure_output_dir(output_path)
+
+    if checkpoint_path is None:
+        checkpoint_path = _default_checkpoint()
+
+    gpu_count = _cuda_device_count() if device in ('cuda', 'default') else 0
+    count = max(1, min(workers, gpu_count, len(image_paths)))
+    pool = [_get_worker()] + [_MLSharpWorker({'CUDA_VISIBLE_DEVICES': str(i)}) for i in range(1, count)]
+    shares = [image_paths[i::count] for i in range(count)]
+
+    print(f"Processing {len(image_paths)} images with {count} ML-Sharp worker(s)")
+    print(f"Output directory: {output_path}")
+
+    def run(worker, share):
+        views = [(image_path, output_path) for image_path in share]
+        return _request_views(worker, _views_job(views, checkpoint_path, device, verbose, pipelined=True))
+
+    if count == 1:
+        return run(pool[0], image_paths)
+
+    try:
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            results = list(executor.map(run, pool, shares))
+    finally:
+        for worker in pool[1:]:
+            worker.stop()
+
+    # Undo the round-robin split
+    ply_paths = [None] * len(image_paths)
+    for i, share_plys in enumerate(results):
+        ply_paths[i::count] = share_plys
+    return ply_paths
+
+
+# Probe results keyed by (interpreter path, mtime); see _python_key()
+_env_cache = {}
+_sharp_package_cache = {}
+
+
+def _python_key():
+    """Cache key that changes whenever the embedded interpreter is replaced, or None if it is missing."""
+    try:
+        return (_MLSHARP_PYTHON_STR, MLSHARP_PYTHON.stat().st_mtime_ns)
+    except OSError:
+        return None
+
+
+def invalidate_env_cache():
+    """
+    Forget cached environment probes, the subprocess environment and the bundled checkpoint
+    lookup (e.g. after installing or repairing).
+    """
+    global _base_env, _bundled_checkpoint
+    _env_cache.clear()
+    _sharp_package_cache.clear()
+    _base_env = None
+    _bundled_checkpoint = False
 
 
 def check_mlsharp_environment():
     """
     Check if ml-sharp embedded Python environment is properly set up.
+    The result is cached until the interpreter file changes or invalidate_env_cache() is called.
     
     Returns:
         dict: Status information with keys 'available', 'python_path', 'message'
     """
+    key = _python_key()
+    if key in _env_cache:
+        return dict(_env_cache[key])
+
     status = {
         'available': False,
-        'python_path': str(MLSHARP_PYTHON),
+        'python_path': _MLSHARP_PYTHON_STR,
         'message': ''
     }
     
-    if not MLSHARP_PYTHON.exists():
+    if key is None:
         status['message'] = f"ML-Sharp Python not found at: {MLSHARP_PYTHON}"
         return status
+
+    # A truncated download or extraction fails here without starting a process
+    try:
+        if MLSHARP_PYTHON.stat().st_size < 1024:
+            status['message'] = f"ML-Sharp Python appears corrupt (file too small): {MLSHARP_PYTHON}"
+            _env_cache[key] = dict(status)
+            return status
+    except OSError as e:
+        status['message'] = f"Error checking ML-Sharp environment: {e}"
+        return status
     
-    # Try to run a simple command to verify it works
+    # Try to run a simple command to verify it works (-S: the probe needs no site-packages).
+    # --version returns in milliseconds; the short timeout keeps a hung interpreter (e.g. a
+    # stuck DLL load) from stalling Blender's UI. A timeout is inconclusive (a busy cold
+    # start, antivirus scanning), so it reports available and is not cached
     try:
         result = subprocess.run(
-            [str(MLSHARP_PYTHON), "--version"],
+            [_MLSHARP_PYTHON_STR, "-S", "--version"],
             capture_output=True,
             text=True,
-            timeout=5
+            timeout=1.0,
+            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
         )
         
         if result.returncode == 0:
@@ -184,6 +716,13 @@ def check_mlsharp_environment():
             status['message'] = f"ML-Sharp environment ready: {result.stdout.strip()}"
         else:
             status['message'] = "ML-Sharp Python found but not responding correctly"
+
+        # Only a completed probe is cached; errors such as a timeout are retried next time
+        _env_cache[key] = dict(status)
+
+    except subprocess.TimeoutExpired:
+        status['available'] = True
+        status['message'] = "ML-Sharp Python found (version check timed out, will recheck)"
             
     except Exception as e:
         status['message'] = f"Error checking ML-Sharp environment: {e}"
@@ -191,26 +730,93 @@ def check_mlsharp_environment():
     return status
 
 
-def verify_sharp_package():
+def verify_sharp_package(strict: bool = False):
     """
     Verify that sharp package is available in ml-sharp environment.
+    By default this only checks that the interpreter and src/sharp/__init__.py exist (the
+    launcher and worker import sharp from src); strict=True imports sharp in a subprocess,
+    with the result cached like check_mlsharp_environment().
 
     Returns:
         bool: True if sharp package is available
     """
-    if not MLSHARP_PYTHON.exists():
+    key = _python_key()
+    if key is None:
         return False
+    if not strict:
+        return (MLSHARP_SRC_DIR / "sharp" / "__init__.py").is_file()
+    if key in _sharp_package_cache:
+        return _sharp_package_cache[key]
 
     try:
         result = subprocess.run(
-            [str(MLSHARP_PYTHON), "-c", "import sharp; print(sharp.__file__)"],
+            [_MLSHARP_PYTHON_STR, "-c", "import sys; sys.path.insert(0, sys.argv[1]); import sharp; print(sharp.__file__)",
+             _MLSHARP_SRC_STR],
             capture_output=True,
             text=True,
             timeout=10
         )
-        return result.returncode == 0
     except:
         return False
+    _sharp_package_cache[key] = result.returncode == 0
+    return _sharp_package_cache[key]
+
+
+def is_standard_ply(ply_path: Path) -> bool:
+    """
+    Check from the header alone whether a PLY is already in industry-standard format:
+    binary little-endian, a single vertex element, float properties in standard order.
+    """
+    return _standard_ply_vertex_count(ply_path) is not None
+
+
+def _standard_ply_vertex_count(ply_path: Path):
+    """Vertex count of an industry-standard PLY (see is_standard_ply), or None for any other file."""
+    try:
+        with open(ply_path, 'rb') as f:
+            head = f.read(4096)
+    except OSError:
+        return None
+
+    end = head.find(b'end_header')
+    if end < 0:
+        return None
+
+    fmt = None
+    elements = []
+    properties = []
+    count = None
+    for line in head[:end].decode('ascii', errors='replace').splitlines():
+        words = line.split()
+        if not words or words[0] in ('ply', 'comment', 'obj_info'):
+            continue
+        if words[0] == 'format':
+            fmt = words[1:2]
+        elif words[0] == 'element':
+            elements.append(words[1])
+            if words[1] == 'vertex' and len(words) == 3 and words[2].isdigit():
+                count = int(words[2])
+        elif words[0] == 'property':
+            if words[1] != 'float' or len(words) != 3:
+                return None
+            properties.append(words[2])
+
+    if (
+        fmt == ['binary_little_endian']
+        and elements == ['vertex']
+        and tuple(properties) == STANDARD_PLY_PROPERTIES
+    ):
+        return count  # None if the vertex element had no parseable count
+    return None
+
+
+def _has_matching_splat(ply_path: Path, vertex_count) -> bool:
+    """Whether the .splat next to ply_path holds one 32-byte record per vertex."""
+    try:
+        return ply_path.with_suffix('.splat').stat().st_size == 32 * vertex_count
+    except OSError:
+        return False
+
 
 def standardize_ply_format(ply_path: Path, verbose: bool = False) -> bool:
     """
@@ -221,6 +827,9 @@ def standardize_ply_format(ply_path: Path, verbose: bool = False) -> bool:
     2. Reorders properties to standard order
     3. Converts quaternions from WXYZ (ML-Sharp) to XYZW (industry standard)
     4. Filters out any NaN/Infinity values
+    5. Writes a matching .splat file next to it
+
+    A PLY that is already standard and has a matching .splat is left untouched.
 
     Args:
         ply_path: Path to PLY file to standardize (modified in-place)
@@ -238,160 +847,23 @@ def standardize_ply_format(ply_path: Path, verbose: bool = False) -> bool:
     if not ply_path.exists():
         raise FileNotFoundError(f"PLY file not found: {ply_path}")
 
-    # Python code to run in ml-sharp environment (has plyfile and numpy)
-    python_code = '''
-import sys
-import numpy as np
-from plyfile import PlyData, PlyElement
-
-def save_as_splat(data, output_path):
-    """Save to 32-byte per splat binary format for Unity/Web."""
-    num_points = len(data)
-    
-    # 1. Position (x, y, z) - 12 bytes
-    pos = np.column_stack([data['x'], data['y'], data['z']]).astype(np.float32)
-    
-    # 2. Scale (exp conversion) - 12 bytes
-    scale = np.column_stack([
-        np.exp(data['scale_0']),
-        np.exp(data['scale_1']),
-        np.exp(data['scale_2'])
-    ]).astype(np.float32)
-    
-    # 3. Color & Opacity (RGBA) - 4 bytes
-    SH_C0 = 0.28209479177387814
-    rgba = np.column_stack([
-        np.clip((0.5 + SH_C0 * data['f_dc_0']) * 255, 0, 255),
-        np.clip((0.5 + SH_C0 * data['f_dc_1']) * 255, 0, 255),
-        np.clip((0.5 + SH_C0 * data['f_dc_2']) * 255, 0, 255),
-        np.clip((1 / (1 + np.exp(-data['opacity']))) * 255, 0, 255)
-    ]).astype(np.uint8)
-    
-    # 4. Rotation (XYZW) - 4 bytes
-    q = np.column_stack([
-        data['rot_0'], data['rot_1'],
-        data['rot_2'], data['rot_3']
-    ]).astype(np.float32)
-    
-    # Normalize quaternions
-    mag = np.linalg.norm(q, axis=1, keepdims=True)
-    q = np.where(mag > 0, q / mag, q)
-    rot = np.clip(q * 128 + 128, 0, 255).astype(np.uint8)
-    
-    # Create structured array for efficient binary packing
-    dtype_splat = np.dtype([
-        ('pos', np.float32, 3),
-        ('scale', np.float32, 3),
-        ('rgba', np.uint8, 4),
-        ('rot', np.uint8, 4)
-    ])
-    
-    splat_data = np.zeros(num_points, dtype=dtype_splat)
-    splat_data['pos'] = pos
-    splat_data['scale'] = scale
-    splat_data['rgba'] = rgba
-    splat_data['rot'] = rot
-    
-    # Write to file
-    with open(output_path, 'wb') as f:
-        f.write(splat_data.tobytes())
-
-def standardize_ply(input_path, output_path):
-    """Convert ML-Sharp PLY to industry-standard format."""
-
-    # Read original PLY
-    plydata = PlyData.read(input_path)
-
-    # Get vertex data
-    if 'vertex' not in plydata:
-        raise ValueError("PLY file has no vertex element")
-
-    vertex = plydata['vertex']
-    data = vertex.data
-    num_points = len(data)
-
-    if num_points == 0:
-        raise ValueError("PLY file has no vertices")
-
-    # Check required properties exist
-    required = ['x', 'y', 'z', 'f_dc_0', 'f_dc_1', 'f_dc_2', 'opacity',
-                'scale_0', 'scale_1', 'scale_2', 'rot_0', 'rot_1', 'rot_2', 'rot_3']
-
-    available_props = list(data.dtype.names)
-    missing = [p for p in required if p not in available_props]
-    if missing:
-        raise ValueError(f"Missing required properties: {missing}")
-
-    # Filter out NaN/Infinity values
-    valid_mask = np.ones(num_points, dtype=bool)
-    for prop in required:
-        valid_mask &= np.isfinite(data[prop])
-
-    filtered_data = data[valid_mask]
-    num_valid = len(filtered_data)
-    num_removed = num_points - num_valid
-
-    if num_valid == 0:
-        raise ValueError("All vertices contain NaN/Infinity values")
-
-    # Define industry-standard property order
-    dtype_standard = [
-        ('x', '<f4'), ('y', '<f4'), ('z', '<f4'),
-        ('scale_0', '<f4'), ('scale_1', '<f4'), ('scale_2', '<f4'),
-        ('rot_0', '<f4'), ('rot_1', '<f4'), ('rot_2', '<f4'), ('rot_3', '<f4'),
-        ('f_dc_0', '<f4'), ('f_dc_1', '<f4'), ('f_dc_2', '<f4'),
-        ('opacity', '<f4'),
-    ]
-
-    # Create new structured array with standard order
-    new_data = np.empty(num_valid, dtype=dtype_standard)
-
-    # Copy position, scale, color, opacity as-is
-    for prop in ['x', 'y', 'z', 'scale_0', 'scale_1', 'scale_2',
-                 'f_dc_0', 'f_dc_1', 'f_dc_2', 'opacity']:
-        new_data[prop] = filtered_data[prop]
-
-    # Convert quaternion from WXYZ (ML-Sharp) to XYZW (industry standard)
-    # ML-Sharp: rot_0=w, rot_1=x, rot_2=y, rot_3=z
-    # Standard: rot_0=x, rot_1=y, rot_2=z, rot_3=w
-    new_data['rot_0'] = filtered_data['rot_1']  # x
-    new_data['rot_1'] = filtered_data['rot_2']  # y
-    new_data['rot_2'] = filtered_data['rot_3']  # z
-    new_data['rot_3'] = filtered_data['rot_0']  # w
-
-    # Save clean .splat version
-    save_as_splat(new_data, output_path.replace('.ply.tmp', '.splat'))
-
-    # Create clean PLY with only vertex element
-    vertex_element = PlyElement.describe(new_data, 'vertex')
-    clean_ply = PlyData([vertex_element], text=False)
-    clean_ply.write(output_path)
-
-    return num_valid, num_removed
-
-if __name__ == "__main__":
-    input_path = sys.argv[1]
-    output_path = sys.argv[2]
-    verbose = len(sys.argv) > 3 and sys.argv[3] == "-v"
-
-    try:
-        num_valid, num_removed = standardize_ply(input_path, output_path)
+    # Nothing to do (and no subprocess to start) if the file is already standard and has a
+    # matching .splat; a standard PLY without one still goes through the conversion, which
+    # writes the .splat
+    vertex_count = _standard_ply_vertex_count(ply_path)
+    if vertex_count is not None and _has_matching_splat(ply_path, vertex_count):
         if verbose:
-            print(f"Standardized PLY: {num_valid} vertices")
-            if num_removed > 0:
-                print(f"Removed {num_removed} invalid vertices (NaN/Infinity)")
-        sys.exit(0)
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
-'''
+            print(f"PLY already in standard format: {ply_path.name}")
+        return True
 
     # Create a temporary file for the standardized output
     temp_output = ply_path.with_suffix('.ply.tmp')
 
+    # Standalone path: predict_gaussians_from_image already standardizes
+    # inside the prediction process, this is for PLYs produced elsewhere
     cmd = [
-        str(MLSHARP_PYTHON),
-        "-c", python_code,
+        _MLSHARP_PYTHON_STR,
+        _POSTPROCESS_SCRIPT_STR,
         str(ply_path),
         str(temp_output)
     ]
@@ -404,7 +876,7 @@ if __name__ == "__main__":
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
+            text=verbose,  # Quiet runs only decode the output on failure
             check=True,
             timeout=60
         )
@@ -425,11 +897,16 @@ if __name__ == "__main__":
         if temp_output.exists():
             temp_output.unlink()
 
+        stdout, stderr = e.stdout, e.stderr
+        if not verbose:
+            stdout = (stdout or b'').decode('utf-8', errors='replace')
+            stderr = (stderr or b'').decode('utf-8', errors='replace')
+
         error_msg = f"PLY standardization failed with exit code {e.returncode}\n"
-        if e.stdout:
-            error_msg += f"Output: {e.stdout}\n"
-        if e.stderr:
-            error_msg += f"Error: {e.stderr}"
+        if stdout:
+            error_msg += f"Output: {stdout}\n"
+        if stderr:
+            error_msg += f"Error: {stderr}"
         raise RuntimeError(error_msg)
 
     except Exception as e:
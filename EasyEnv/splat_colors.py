@@ -0,0 +1,98 @@
+"""
+Color conversion for imported 3DGS point data.
+Turns spherical-harmonics DC terms and opacity logits into clamped RGBA.
+"""
+
+import threading
+
+import numpy as np
+
+# Numba is optional; Blender does not ship it
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# SciPy ships with the add-on wheels, but keep the pure NumPy sigmoid as fallback
+try:
+    from scipy.special import expit
+except ImportError:
+    expit = None
+
+
+# float32 constants keep both kernels in single precision (no float64 promotion)
+SH_0 = np.float32(0.28209479177387814)  # Zeroth-order spherical harmonics coefficient
+_HALF = np.float32(0.5)
+_ZERO = np.float32(0.0)
+_ONE = np.float32(1.0)
+
+
+def _build_color_numpy(attributes, out):
+    """Vectorized fallback used when Numba is not available."""
+    f_dc_0, f_dc_1, f_dc_2, opacity = attributes
+    color = out.reshape(-1, 4)
+    rgb = color[:, :3]
+    # Write straight into the output columns so no temporaries are allocated
+    for channel, f_dc in enumerate((f_dc_0, f_dc_1, f_dc_2)):
+        np.multiply(f_dc, SH_0, out=rgb[:, channel])
+    rgb += _HALF
+    np.clip(rgb, _ZERO, _ONE, out=rgb)
+
+    # Sigmoid is already bounded to [0, 1], so alpha needs no clip
+    alpha = color[:, 3]
+    if expit is not None:
+        expit(opacity, out=alpha)
+    else:
+        np.negative(opacity, out=alpha)
+        np.exp(alpha, out=alpha)
+        alpha += _ONE
+        np.reciprocal(alpha, out=alpha)
+
+
+if njit is not None:
+    # Explicit signature compiles (or loads from the on-disk cache) at import time,
+    # so the first import does not stall on JIT; see warm_up()
+    @njit('void(float32[:, ::1], float32[::1])', parallel=True, fastmath=True, cache=True, nogil=True)
+    def _build_color_numba(attributes, out):
+        """Fused single-pass kernel: one parallel loop, one write stream."""
+        for i in prange(attributes.shape[1]):
+            r = attributes[0, i] * SH_0 + _HALF
+            g = attributes[1, i] * SH_0 + _HALF
+            b = attributes[2, i] * SH_0 + _HALF
+            a = _ONE / (_ONE + np.exp(-attributes[3, i]))
+            out[i * 4 + 0] = min(_ONE, max(_ZERO, r))
+            out[i * 4 + 1] = min(_ONE, max(_ZERO, g))
+            out[i * 4 + 2] = min(_ONE, max(_ZERO, b))
+            out[i * 4 + 3] = min(_ONE, max(_ZERO, a))
+else:
+    _build_color_numba = None
+
+# Numba's default (workqueue) threading layer aborts the process when two threads run a
+# parallel kernel at once, e.g. warm_up() on its register thread and an import
+_numba_lock = threading.Lock()
+
+
+def build_color_buffer(attributes):
+    """
+    Convert per-point 3DGS attributes into a flat RGBA color buffer.
+
+    Args:
+        attributes: float32 array of shape (4, N) holding the f_dc_0, f_dc_1,
+            f_dc_2 and opacity rows, each row contiguous
+
+    Returns:
+        np.ndarray: Contiguous float32 array of length 4*N (R, G, B, A per point),
+        ready to pass to foreach_set("color", ...)
+    """
+    out = np.empty(attributes.shape[1] * 4, dtype=np.float32)
+    if _build_color_numba is not None:
+        with _numba_lock:
+            _build_color_numba(attributes, out)
+    else:
+        _build_color_numpy(attributes, out)
+    return out
+
+
+def warm_up():
+    """Run the color kernel once on a tiny input so the first real import is hot."""
+    build_color_buffer(np.zeros((4, 1), dtype=np.float32))
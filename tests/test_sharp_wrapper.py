@@ -0,0 +1,80 @@
+"""
+Tests for the PLY header checks in sharp_wrapper (run: python -m unittest discover -s tests).
+EasyEnv/__init__.py imports bpy, so the package is stubbed to import sharp_wrapper alone.
+"""
+
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+ADDON_DIR = Path(__file__).resolve().parent.parent / "EasyEnv"
+if "EasyEnv" not in sys.modules:
+    package = types.ModuleType("EasyEnv")
+    package.__path__ = [str(ADDON_DIR)]
+    sys.modules["EasyEnv"] = package
+
+from EasyEnv import sharp_wrapper  # noqa: E402
+
+
+def standard_header(vertex_count="10", properties=sharp_wrapper.STANDARD_PLY_PROPERTIES):
+    lines = ["ply", "format binary_little_endian 1.0", f"element vertex {vertex_count}"]
+    lines += [f"property float {name}" for name in properties]
+    lines.append("end_header")
+    return ("\n".join(lines) + "\n").encode("ascii")
+
+
+class StandardPlyHeaderTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, data):
+        path = self.dir / name
+        path.write_bytes(data)
+        return path
+
+    def test_standard_header(self):
+        ply = self.write("a.ply", standard_header() + bytes(10 * 56))
+        self.assertTrue(sharp_wrapper.is_standard_ply(ply))
+        self.assertEqual(sharp_wrapper._standard_ply_vertex_count(ply), 10)
+
+    def test_truncated_header(self):
+        ply = self.write("a.ply", standard_header()[:60])
+        self.assertIsNone(sharp_wrapper._standard_ply_vertex_count(ply))
+        self.assertFalse(sharp_wrapper.is_standard_ply(ply))
+
+    def test_not_a_ply(self):
+        ply = self.write("a.ply", b"\x00\x01 garbage, no header at all")
+        self.assertIsNone(sharp_wrapper._standard_ply_vertex_count(ply))
+        self.assertFalse(sharp_wrapper.is_standard_ply(ply))
+
+    def test_missing_file(self):
+        self.assertIsNone(sharp_wrapper._standard_ply_vertex_count(self.dir / "missing.ply"))
+        self.assertFalse(sharp_wrapper.is_standard_ply(self.dir / "missing.ply"))
+
+    def test_non_standard_header(self):
+        properties = sharp_wrapper.STANDARD_PLY_PROPERTIES[::-1]
+        ply = self.write("a.ply", standard_header(properties=properties))
+        self.assertIsNone(sharp_wrapper._standard_ply_vertex_count(ply))
+        self.assertFalse(sharp_wrapper.is_standard_ply(ply))
+
+    def test_unparseable_vertex_count(self):
+        ply = self.write("a.ply", standard_header(vertex_count="many"))
+        self.assertIsNone(sharp_wrapper._standard_ply_vertex_count(ply))
+        self.assertFalse(sharp_wrapper.is_standard_ply(ply))
+
+    def test_unreadable_ply_is_never_skipped_because_of_an_empty_splat(self):
+        ply = self.write("a.ply", b"garbage")
+        self.write("a.splat", b"")
+        vertex_count = sharp_wrapper._standard_ply_vertex_count(ply)
+        self.assertFalse(vertex_count is not None and sharp_wrapper._has_matching_splat(ply, vertex_count))
+
+
+if __name__ == "__main__":
+    unittest.main()